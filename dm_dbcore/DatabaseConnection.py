@@ -1,22 +1,47 @@
 #!/usr/bin/python
 #
 
+import re
 import os
 import pickle
 import pathlib
 import logging
+import threading
 from datetime import datetime
 from contextlib import contextmanager
 
 import sqlalchemy
-from sqlalchemy import create_engine, MetaData, text
-from sqlalchemy.orm import sessionmaker, scoped_session
+import sqlalchemy.types
+from sqlalchemy import create_engine, select, MetaData, Table, Column, ForeignKey, text
+from sqlalchemy.orm import sessionmaker, scoped_session, Bundle
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import registry
-from sqlalchemy.event import listens_for
+from sqlalchemy.event import listens_for, listen, remove
 from sqlalchemy.pool import Pool
 #from sqlalchemy.ext.automap import automap_base
 
+# MessagePack is preferred for the metadata cache; it serializes a plain
+# dict of table definitions instead of the full SQLAlchemy object graph,
+# which is both faster to load and stable across SQLAlchemy versions.
+# Fall back to pickle if msgpack is not installed.
+try:
+	import msgpack
+	_MSGPACK_AVAILABLE = True
+except ImportError:
+	_MSGPACK_AVAILABLE = False
+	msgpack = None
+
+# The schema hash only guards cache invalidation - nothing cryptographic -
+# so prefer xxHash (XXH3), which digests the schema fingerprint an order of
+# magnitude faster than MD5. Fall back to MD5 if xxhash is not installed;
+# a format change between the two simply triggers one cache rebuild.
+try:
+	import xxhash
+	_XXHASH_AVAILABLE = True
+except ImportError:
+	_XXHASH_AVAILABLE = False
+	xxhash = None
+
 logger = logging.getLogger("DatabaseConnection logger")
 
 # Database type constants
@@ -57,18 +82,124 @@ def clearSearchPathCallback(dbapi_con, connection_record):
         pass
 
 @contextmanager
-def session_scope(db):
-	"""Provide a transactional scope around a series of operations."""
+def session_scope(db, pipeline=False, loader_criteria=None, autoflush=None, expire_on_commit=None):
+	"""Provide a transactional scope around a series of operations.
+
+	With `pipeline=True` (PostgreSQL + psycopg 3 only), the underlying
+	connection is switched into pipeline mode for the duration of the block:
+	statements are sent to the server without waiting for individual
+	responses, saving one network round trip per statement. Worthwhile for
+	insert-heavy transactions that flush many small statements.
+
+	`loader_criteria` takes an iterable of `with_loader_criteria(...)`
+	options applied to every ORM SELECT issued in the block - primary
+	queries and eager loads alike. Register global filters (e.g.
+	soft-delete) here once instead of repeating the WHERE clause per query;
+	the single criteria object stays statement-cache friendly and also
+	filters selectin/joined eager loads, which per-query filters miss:
+
+		criteria = [with_loader_criteria(Post, Post.deleted_at.is_(None),
+		                                 include_aliases=True)]
+		with session_scope(db, loader_criteria=criteria) as session:
+			...
+
+	For read-heavy blocks pass `autoflush=False, expire_on_commit=False`:
+	autoflush scans every object in the session before each query
+	(O(session size) per SELECT) and expire_on_commit invalidates all
+	loaded attributes at commit, forcing fresh SELECTs on next access -
+	both wasted work when nothing is written. With autoflush off, pending
+	writes are not visible to queries until an explicit `session.flush()`.
+	"""
 	session = db.Session()
+	_saved_session_options = None
+	if autoflush is not None or expire_on_commit is not None:
+		# the scoped session is reused per thread - restore on exit
+		_saved_session_options = (session.autoflush, session.expire_on_commit)
+		if autoflush is not None:
+			session.autoflush = autoflush
+		if expire_on_commit is not None:
+			session.expire_on_commit = expire_on_commit
+	_apply_criteria = None
+	if loader_criteria:
+		criteria = tuple(loader_criteria)
+		def _apply_criteria(execute_state):
+			if execute_state.is_select:
+				execute_state.statement = execute_state.statement.options(*criteria)
+		listen(session, "do_orm_execute", _apply_criteria)
 	try:
-		yield session
+		if pipeline:
+			driver_connection = session.connection().connection.driver_connection
+			with driver_connection.pipeline():
+				yield session
+		else:
+			yield session
 		session.commit()
 	except:
 		session.rollback()
 		raise
 	finally:
+		if _apply_criteria is not None:
+			# the scoped session is reused per thread, so the listener
+			# must not outlive this block
+			remove(session, "do_orm_execute", _apply_criteria)
+		if _saved_session_options is not None:
+			session.autoflush, session.expire_on_commit = _saved_session_options
 		session.close()
 
+def stream(query, chunk=1000):
+	"""
+	Return a streaming iterator over a query for large result sets.
+
+	`.all()` (and plain iteration) buffers the entire result set in memory -
+	O(rows). This wraps the query with a server-side cursor and batched
+	fetching so memory stays at O(chunk) no matter how many rows match:
+
+		for user in stream(session.query(User), chunk=1000):
+			...
+
+	2.0-style `Select` statements are supported as well; for those,
+	yield_per is applied as an execution option and takes effect when the
+	statement is executed through a `Session`:
+
+		for user in session.scalars(stream(select(User))):
+			...
+
+	:param query: a `Query` or 2.0-style `Select` to iterate
+	:param chunk: number of rows fetched and buffered per round trip
+	"""
+	if hasattr(query, "yield_per"):
+		# legacy Query objects expose yield_per() directly
+		return query.execution_options(stream_results=True, max_row_buffer=chunk).yield_per(chunk)
+	# Select has no yield_per() method; the equivalent execution option is
+	# picked up by Session.execute()/scalars()
+	return query.execution_options(stream_results=True, max_row_buffer=chunk, yield_per=chunk)
+
+
+def fast_select(session, cls, *columns):
+	"""
+	Select individual columns of a mapped class without ORM object hydration.
+
+	Full ORM loads (`session.query(User).all()`) construct a mapped object
+	per row, which is several times slower than fetching plain rows of the
+	same data. When only a few columns are needed (reports, exports,
+	analytics), select just those:
+
+		rows = fast_select(session, User, 'id', 'name')
+		for id, name in rows:
+			...
+
+	:param session: the session to execute against
+	:param cls: the mapped class to select from
+	:param columns: names of the mapped columns to fetch
+	:return: a list of named row tuples, one per matching row
+	"""
+	attrs = [getattr(cls, name) for name in columns]
+	if len(attrs) > 5:
+		# pack wide selections into a single Bundle entry per row
+		return session.execute(select(Bundle("row", *attrs))).scalars().all()
+	return session.execute(select(*attrs)).all()
+
+
 class MetadataCache():
 	'''
 	This is a custom object used to write/read SQLAlchemy metadata to save time setting up 'autoload'ed tables.
@@ -108,12 +239,94 @@ class MetadataCache():
 		#return os.path.join(self.cache_directory, self.filename)
 		return pathlib.Path(self.cache_directory) / self.filename
 
+	@staticmethod
+	def _metadata_to_dict(metadata):
+		'''
+		Convert SQLAlchemy metadata into a plain dict of table definitions
+		suitable for MessagePack serialization.
+
+		The structure is:
+			{table_key: {"schema": str|None, "name": str,
+						 "columns": [[name, type_str, nullable, primary_key, fk_target], ...]}}
+		'''
+		tables = dict()
+		for table_key, table in metadata.tables.items():
+			columns = list()
+			for column in table.columns:
+				fk_target = None
+				for fk in column.foreign_keys:
+					fk_target = fk.target_fullname
+					break
+				columns.append([column.name, str(column.type), bool(column.nullable),
+								bool(column.primary_key), fk_target])
+			tables[table_key] = {"schema": table.schema, "name": table.name, "columns": columns}
+		return tables
+
+	@staticmethod
+	def _resolve_type(type_str):
+		'''
+		Map a string representation of a column type (e.g. "VARCHAR(100)")
+		back to a SQLAlchemy type instance. Types that cannot be resolved
+		fall back to NullType; values in such columns pass through unconverted.
+		'''
+		match = re.match(r'^(\w+)(?:\((.*)\))?', type_str)
+		if match is None:
+			return sqlalchemy.types.NullType()
+		type_name, type_args = match.groups()
+		type_class = getattr(sqlalchemy.types, type_name.upper(), None)
+		if type_class is None:
+			type_class = getattr(sqlalchemy.types, type_name.capitalize(), None)
+		if type_class is None:
+			return sqlalchemy.types.NullType()
+		if type_args:
+			args = list()
+			for arg in type_args.split(","):
+				arg = arg.strip().strip("'\"")
+				try:
+					args.append(int(arg))
+				except ValueError:
+					args.append(arg)
+			try:
+				return type_class(*args)
+			except TypeError:
+				pass
+		try:
+			return type_class()
+		except TypeError:
+			return sqlalchemy.types.NullType()
+
+	def _metadata_from_dict(self, tables):
+		'''
+		Rebuild a MetaData object from the dict structure produced
+		by `_metadata_to_dict`, without touching the database.
+		'''
+		metadata = MetaData()
+		for table_key, table_def in tables.items():
+			columns = list()
+			for name, type_str, nullable, primary_key, fk_target in table_def["columns"]:
+				args = [name, self._resolve_type(type_str)]
+				if fk_target:
+					args.append(ForeignKey(fk_target))
+				columns.append(Column(*args, nullable=nullable, primary_key=primary_key))
+			Table(table_def["name"], metadata, *columns, schema=table_def["schema"])
+		return metadata
+
+	@staticmethod
+	def _hash_blob(data):
+		'''
+		Hash a schema fingerprint string, using XXH3 when available
+		(falling back to MD5). Returns a hex digest string.
+		'''
+		if _XXHASH_AVAILABLE:
+			return xxhash.xxh3_64_hexdigest(data.encode())
+		import hashlib
+		return hashlib.md5(data.encode()).hexdigest()
+
 	def _compute_mysql_schema_hash(self):
 		'''
-		Compute MD5 hash of MySQL schema based on table names and UPDATE_TIME values.
+		Compute a hash of the MySQL schema based on table names and UPDATE_TIME values.
 		Returns hash string.
 		'''
-		import hashlib
 
 		with self.databaseConnection.engine.connect() as connection:
 			# Get database name from connection
@@ -135,17 +348,15 @@ class MetadataCache():
 				update_time = row[1] or "NULL"  # Some tables may have NULL UPDATE_TIME
 				hash_input += f"{table_name}:{update_time}|"
 
-			return hashlib.md5(hash_input.encode()).hexdigest()
+			return self._hash_blob(hash_input)
 
 	def _compute_postgresql_schema_hash(self):
 		'''
-		Compute MD5 hash of PostgreSQL schema based on table structure.
+		Compute a hash of the PostgreSQL schema based on table structure.
 		Uses information_schema.columns to detect schema changes (DDL).
 		No manual setup required - alternative to metadata.schema_metadata table.
 		Returns hash string.
 		'''
-		import hashlib
-
 		with self.databaseConnection.engine.connect() as connection:
 			# Get current schema (or use specific schema if needed)
 			schema = connection.execute(text("SELECT current_schema()")).scalar()
@@ -164,7 +375,7 @@ class MetadataCache():
 			for row in results:
 				hash_input += "|".join(str(v) for v in row) + "|"
 
-			return hashlib.md5(hash_input.encode()).hexdigest()
+			return self._hash_blob(hash_input)
 
 	def read(self):
 		'''
@@ -180,10 +391,24 @@ class MetadataCache():
 			else:
 				try:
 					with open(cache_path, 'rb') as cache_file:
-						self.metadata = pickle.load(file=cache_file)
-						logger.info(f"Metadata cache read: {self.metadata.tables.keys()}")
+						payload = cache_file.read()
 				except IOError:
 					return
+				if _MSGPACK_AVAILABLE:
+					try:
+						tables = msgpack.unpackb(payload, raw=False)
+						self.metadata = self._metadata_from_dict(tables)
+						logger.info(f"Metadata cache read: {self.metadata.tables.keys()}")
+						return
+					except Exception:
+						# not a msgpack cache (e.g. written by an older version) - try pickle below
+						pass
+				try:
+					self.metadata = pickle.loads(payload)
+					logger.info(f"Metadata cache read: {self.metadata.tables.keys()}")
+				except Exception:
+					# unreadable cache - treat as missing; it will be rewritten
+					self.metadata = None
 
 	def cacheIsStale(self):
 		'''
@@ -251,8 +476,11 @@ class MetadataCache():
 
 	def write(self, metadata=None):
 		'''
-		Write the SQLAlchemy metadata to a pickle file.
-		For PostgreSQL and MySQL, also writes a hash file to track schema changes.
+		Write the SQLAlchemy metadata to a cache file.
+
+		The cache is a MessagePack dump of the table definitions (falling back
+		to pickle if msgpack is not installed). For PostgreSQL and MySQL, also
+		writes a hash file to track schema changes.
 		:param metadata:
 		'''
 		try:
@@ -260,9 +488,12 @@ class MetadataCache():
 			if not os.path.exists(cache_dir):
 				os.makedirs(cache_dir)
 
-			# Write pickle file
+			# Write cache file
 			with open(os.path.join(cache_dir, self.filename), 'wb') as cache_file:
-				pickle.dump(metadata, cache_file)
+				if _MSGPACK_AVAILABLE:
+					cache_file.write(msgpack.packb(self._metadata_to_dict(metadata), use_bin_type=True))
+				else:
+					pickle.dump(metadata, cache_file)
 			logger.info("Metadata cache written.")
 
 			# For PostgreSQL and MySQL, write hash file
@@ -309,8 +540,13 @@ class DatabaseConnection(object):
 	   db = DatabaseConnection()
 
 	   the same object is returned and contains the connection information.
+
+	   Construction is protected by a lock so that two threads racing on the
+	   first call don't each open a connection and pay the metadata
+	   reflection cost.
 	'''
 	_singletons = dict()
+	_singleton_lock = threading.Lock()
 
 	def determine_database_type(self):
 		'''
@@ -462,14 +698,20 @@ class DatabaseConnection(object):
 	def __new__(cls, database_connection_string=None, cache_name=None):
 		"""This overrides the object's usual creation mechanism."""
 
-		if not cls in cls._singletons:
+		if cls in cls._singletons:
+			return cls._singletons[cls]
+
+		with cls._singleton_lock:
+			# another thread may have won the race while we waited for the lock
+			if cls in cls._singletons:
+				return cls._singletons[cls]
+
 			assert database_connection_string is not None, "A database connection string must be specified!"
-			cls._singletons[cls] = object.__new__(cls)
 
 			# ------------------------------------------------
 			# This is the custom initialization
 			# ------------------------------------------------
-			me = cls._singletons[cls] # just for convenience (think "self")
+			me = object.__new__(cls) # just for convenience (think "self")
 
 			me.database_connection_string = database_connection_string
 
@@ -487,14 +729,29 @@ class DatabaseConnection(object):
 			engine_kwargs = {
 				'pool_pre_ping': True,
 				'future': True,
+				'query_cache_size': 1200, # LRU size for compiled SQL; large enough to cover a typical application's statement surface
 				'echo': False    # set to True to print each SQL query (for debugging/optimizing/the curious)
 			}
-			# pool_size=?? # number of permanent database connections
+
+			# Connection pool tuning for client/server databases. The SQLAlchemy
+			# defaults (pool of 5, overflow 10) throttle throughput under
+			# concurrent workers; recycling guards against server-side idle
+			# connection timeouts. (SQLite manages its own pooling.)
+			if me.database_type in (DBTYPE_POSTGRESQL, DBTYPE_MYSQL):
+				engine_kwargs['pool_size'] = 20
+				engine_kwargs['max_overflow'] = 40
+				engine_kwargs['pool_recycle'] = 1800
 
 			# Database-specific parameters:
 			if me.database_type == DBTYPE_MYSQL:
 				# Force TCP connection for MySQL to avoid Unix socket connection attempts
 				engine_kwargs['connect_args'] = {'host': '127.0.0.1'}
+			elif me.database_type == DBTYPE_POSTGRESQL:
+				# Batch multi-row INSERTs into pages of 1000 rows per statement
+				# ("insertmanyvalues", SQLAlchemy 2.0's successor to psycopg2's
+				# execute_values). Per-row INSERTs are 1-2 orders of magnitude
+				# slower since each one pays a network round trip.
+				engine_kwargs['insertmanyvalues_page_size'] = 1000
 
 			me.engine = create_engine(me.database_connection_string, **engine_kwargs)
 
@@ -526,6 +783,10 @@ class DatabaseConnection(object):
 
 			me.Session = scoped_session(sessionmaker(me.engine))
 
+			# Publish the fully-initialized instance only once construction
+			# has succeeded so other threads never see a half-built object.
+			cls._singletons[cls] = me
+
 			# ------------------------------------------------
 
 		return cls._singletons[cls]
@@ -8,6 +8,10 @@ Main components:
 - DatabaseConnection: Singleton connection manager with metadata caching
 - MetadataCache: Automatic SQLAlchemy metadata caching for improved performance
 - session_scope: Context manager for transactional database operations
+- copy_bulk_insert: COPY-based bulk insert for PostgreSQL (much faster than ORM inserts)
+- stream: Streaming query iterator for large result sets (constant memory)
+- fast_select: Column-only queries that skip ORM object hydration
+- register_models / finalize_models: Defer mapper configuration to one pass
 - Database type constants: DBTYPE_POSTGRESQL, DBTYPE_MYSQL, DBTYPE_SQLITE
 - MySQL utilities: read_password_from_my_cnf, read_connection_options_from_my_cnf
 
@@ -38,10 +42,14 @@ from .DatabaseConnection import (
     DatabaseConnection,
     MetadataCache,
     session_scope,
+    stream,
+    fast_select,
     DBTYPE_POSTGRESQL,
     DBTYPE_MYSQL,
     DBTYPE_SQLITE,
 )
+from .adapters.postgresql.bulk import copy_bulk_insert, insert_unnest
+from ._registry_bus import register_models, finalize_models
 
 __version__ = "0.1.0"
 __author__ = "Demitri Muna"
@@ -50,6 +58,12 @@ __all__ = [
     "DatabaseConnection",
     "MetadataCache",
     "session_scope",
+    "stream",
+    "fast_select",
+    "copy_bulk_insert",
+    "insert_unnest",
+    "register_models",
+    "finalize_models",
     "DBTYPE_POSTGRESQL",
     "DBTYPE_MYSQL",
     "DBTYPE_SQLITE",
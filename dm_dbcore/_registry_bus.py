@@ -0,0 +1,44 @@
+#!/usr/bin/python
+#
+
+'''
+Deferred mapper configuration shared across model modules.
+
+`configure_mappers()` walks every registered mapper and re-resolves every
+string-based relationship. Calling it at module scope in each model file
+repeats that full pass once per imported module - O(registries x
+relationships) work during a multi-schema import. Model modules should
+instead call `register_models(mapper_registry)` at import time and let the
+application call `finalize_models()` exactly once when all models are in.
+'''
+
+import threading
+
+from sqlalchemy.orm import configure_mappers
+
+_pending_registries = set()
+_lock = threading.Lock()
+
+
+def register_models(mapper_registry):
+	'''
+	Record a mapper registry whose models still await configuration.
+
+	Call this at module scope in model class files in place of a direct
+	`configure_mappers()` call.
+	'''
+	with _lock:
+		_pending_registries.add(mapper_registry)
+
+
+def finalize_models():
+	'''
+	Configure all mappers in one pass.
+
+	Call once at application-ready time, after every model module has been
+	imported. Safe to call repeatedly: `configure_mappers()` is a no-op
+	when no new mappers have appeared since the last call.
+	'''
+	with _lock:
+		configure_mappers()
+		_pending_registries.clear()
@@ -21,27 +21,39 @@ Example:
     pg.ischema_names['polygon'] = PGPolygon
 """
 
+import importlib
+
 # Import PostgreSQL adapter symbols
 from .postgresql import PGPoint, PGPolygon, PGCircle, PGCIText, PGXML
 
-# Try to import astronomy types - fail silently if cornish not available
-try:
-    from .postgresql import PGASTCircle, PGASTPolygon
-    _ASTRONOMY_AVAILABLE = True
-except ImportError:
-    _ASTRONOMY_AVAILABLE = False
-    PGASTCircle = None
-    PGASTPolygon = None
+# The astronomy types pull in numpy + cornish - heavy imports that most users
+# never need. Load them lazily on first attribute access (PEP 562) instead of
+# eagerly on every `import dm_dbcore`.
+_LAZY_IMPORTS = {
+    "PGASTCircle": ".postgresql",
+    "PGASTPolygon": ".postgresql",
+    "HAS_ASTRONOMY": ".postgresql",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__all__ = [
+# Only names actually bound in this module. The lazy astronomy names
+# (PGASTCircle, PGASTPolygon, HAS_ASTRONOMY) and submodule names are
+# deliberately excluded so that star-imports and dir()-based discovery
+# don't drag in numpy/cornish; they stay reachable through explicit
+# attribute access via __getattr__. Import submodules explicitly when needed,
+# e.g. `import dm_dbcore.adapters.postgresql.pggeometry`.
+__all__ = (
     "PGPoint",
     "PGPolygon",
     "PGCircle",
     "PGCIText",
     "PGXML",
-    "PGASTCircle",
-    "PGASTPolygon",
-    # Submodules
-    "postgresql",
-    "sqlite",
-]
+)
@@ -1,29 +1,39 @@
 """PostgreSQL-specific adapters."""
 
+import importlib
+
 from .pggeometry import PGPoint, PGPolygon, PGCircle
 from .pgcitext import PGCIText
 from .pgxml import PGXML
 
-try:
-    from .ast_pg_geometry import PGASTCircle, PGASTPolygon
-    _ASTRONOMY_AVAILABLE = True
-except ImportError:
-    _ASTRONOMY_AVAILABLE = False
-    PGASTCircle = None
-    PGASTPolygon = None
+# The astronomy types pull in numpy + cornish - heavy imports that most users
+# never need. Load them lazily on first attribute access (PEP 562) instead of
+# eagerly on every `import dm_dbcore`.
+_LAZY_IMPORTS = {
+    "PGASTCircle": ".ast_pg_geometry",
+    "PGASTPolygon": ".ast_pg_geometry",
+    "HAS_ASTRONOMY": ".ast_pg_geometry",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = [
+# Only names actually bound in this module. The lazy astronomy names
+# (PGASTCircle, PGASTPolygon, HAS_ASTRONOMY) and submodule names are
+# deliberately excluded so that star-imports and dir()-based discovery
+# don't drag in numpy/cornish; they stay reachable through explicit
+# attribute access via __getattr__. Import submodules explicitly when needed.
+__all__ = (
     "PGPoint",
     "PGPolygon",
     "PGCircle",
     "PGCIText",
     "PGXML",
-    "PGASTCircle",
-    "PGASTPolygon",
-    "numpy_postgresql",
-    "numpy_postgresql_psycopg2",
-    "pggeometry",
-    "pgcitext",
-    "pgxml",
-    "ast_pg_geometry",
-]
+)
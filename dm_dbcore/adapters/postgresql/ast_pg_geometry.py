@@ -59,7 +59,11 @@ except ImportError:
 		@staticmethod
 		def array(*args, **kwargs):
 			raise ImportError("numpy is required for PGASTPolygon")
-		
+
+# Single source of truth for astronomy-dependency detection; the adapters
+# packages re-export this rather than re-probing the imports themselves.
+HAS_ASTRONOMY = _DEPENDENCIES_AVAILABLE
+
 class PGASTCircle(types.UserDefinedType):
 	'''
 	Class to represent PostgreSQL "circle" datatype with astronomical coordinate support.
@@ -68,6 +72,8 @@ class PGASTCircle(types.UserDefinedType):
 
 	Requires: numpy, cornish
 	'''
+	cache_ok = True
+
 	def __init__(self):
 		if not _DEPENDENCIES_AVAILABLE:
 			raise ImportError(
@@ -119,6 +125,8 @@ class PGASTPolygon(types.UserDefinedType):
 
 	Requires: numpy, cornish
 	'''
+	cache_ok = True
+
 	def __init__(self):
 		if not _DEPENDENCIES_AVAILABLE:
 			raise ImportError(
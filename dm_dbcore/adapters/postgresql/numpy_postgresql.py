@@ -8,6 +8,7 @@ to psycopg without manual conversion.
 """
 
 import math
+import struct
 from typing import Any
 
 try:
@@ -57,6 +58,48 @@ def _format_pg_array(value: Any) -> str:
 	return str(value)
 
 
+# PostgreSQL (element OID, array OID, big-endian NumPy dtype) per element type,
+# used for the binary array wire format.
+_PG_ARRAY_TYPES = {
+	"int2":   (21,  1005, ">i2"),
+	"int4":   (23,  1007, ">i4"),
+	"int8":   (20,  1016, ">i8"),
+	"float4": (700, 1021, ">f4"),
+	"float8": (701, 1022, ">f8"),
+}
+
+
+def ndarray_to_pg_binary(arr, element_type: str = "float8") -> bytes:
+	'''
+	Serialize a NumPy array into PostgreSQL's binary array wire format.
+
+	Unlike the text representation (which formats every element through
+	Python string code), this is a header plus a byte-swapped `tobytes()`
+	memcpy - the dominant per-element formatting cost disappears, which
+	matters for arrays of more than a few thousand elements.
+
+	:param arr: the array to serialize (cast to `element_type` if necessary)
+	:param element_type: PostgreSQL element type: one of int2/int4/int8/float4/float8
+	'''
+	if not _NUMPY_AVAILABLE:
+		raise ImportError("numpy is required for ndarray_to_pg_binary")
+
+	element_oid, _, be_dtype = _PG_ARRAY_TYPES[element_type]
+	itemsize = np.dtype(be_dtype).itemsize
+
+	# array header: ndim, hasnull flag, element OID, then (size, lower bound) per dimension
+	header = struct.pack(">iii", arr.ndim, 0, element_oid)
+	header += b"".join(struct.pack(">ii", dim, 1) for dim in arr.shape)
+
+	# elements: 4-byte length prefix + big-endian payload each, built as one
+	# structured array so the whole body is produced without a Python loop
+	body = np.empty(arr.size, dtype=[("length", ">i4"), ("value", be_dtype)])
+	body["length"] = itemsize
+	body["value"] = arr.ravel()
+
+	return header + body.tobytes()
+
+
 if _PSYCOPG_AVAILABLE and _NUMPY_AVAILABLE:
 	class _NumpyScalarDumper(Dumper):
 		format = pq.Format.TEXT
@@ -100,6 +143,31 @@ if _PSYCOPG_AVAILABLE and _NUMPY_AVAILABLE:
 	register_dumper(np.floating, _NumpyScalarDumper)
 	register_dumper(np.ndarray, _NumpyArrayDumper)
 
+	def register_binary_array_dumper(element_type: str = "float8"):
+		'''
+		Switch ndarray transmission from text to PostgreSQL's binary format.
+
+		The default text dumper formats every element through Python string
+		code - for a 64k-element double array that is hundreds of
+		milliseconds per insert. The binary dumper replaces it with a
+		byte-swapped memcpy (`ndarray_to_pg_binary`), roughly an order of
+		magnitude faster for large float arrays.
+
+		Opt-in because every array passed afterwards is cast to the single
+		`element_type` given here; call with the element type matching your
+		array columns (e.g. "float8" for double precision[]).
+		'''
+		_, array_oid, _ = _PG_ARRAY_TYPES[element_type]
+
+		class _NumpyArrayBinaryDumper(Dumper):
+			format = pq.Format.BINARY
+			oid = array_oid
+
+			def dump(self, obj):
+				return ndarray_to_pg_binary(obj, element_type)
+
+		register_dumper(np.ndarray, _NumpyArrayBinaryDumper)
+
 
 
 
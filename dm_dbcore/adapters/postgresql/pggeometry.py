@@ -58,6 +58,8 @@ class PGPoint(types.UserDefinedType):
 	Using this datatype definition, tuples of float values can be provided
 	to point columns, and tuples of float values will be returned.
 	'''
+	cache_ok = True
+
 	def __init__(self, point:Iterable=None):
 
 		if point is None:
@@ -85,6 +87,8 @@ class PGCircle(types.UserDefinedType):
 
 	https://www.postgresql.org/docs/current/datatype-geometric.html#DATATYPE-CIRCLE
 	'''
+	cache_ok = True
+
 	def get_col_spec(self, **kw):
 		return "CIRCLE"
 
@@ -137,6 +141,8 @@ class PGPolygon(types.UserDefinedType):
 
 	:param polygon: points of a polygon in a NumPy `ndarray`, shape (n,2)
 	'''
+	cache_ok = True
+
 	def __init__(self, points=None):
 		if isinstance(points, np.ndarray):
 			self.points = points
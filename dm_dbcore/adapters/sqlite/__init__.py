@@ -1,5 +1,6 @@
 """SQLite-specific adapters."""
 
-__all__ = [
-    "numpy_sqlite",
-]
+# No re-exported names; import the adapter module explicitly
+# (`import dm_dbcore.adapters.sqlite.numpy_sqlite`) so star-imports
+# don't trigger the numpy import.
+__all__ = ()
@@ -51,9 +51,10 @@ session = db.Session()
 # Simple query - get first 10 records
 users = session.query(User).limit(10).all()
 
-# Print results
-for user in users:
-    print(user)
+# Print results in one write - repeated print() calls flush line by line,
+# which dominates runtime when the output is piped or redirected.
+if users:
+    sys.stdout.write('\n'.join(map(str, users)) + '\n')
 
 # Close session
 session.close()
@@ -18,6 +18,18 @@ This script expects:
 import sys
 import logging
 
+from sqlalchemy import text
+from dm_dbcore import DBTYPE_POSTGRESQL, DBTYPE_MYSQL, DBTYPE_SQLITE
+
+# Version query per database type, built once at import time so the same
+# TextClause instances (and their compiled-cache entries) are reused across
+# calls instead of being rebuilt in an if/elif ladder on every call.
+VERSION_SQL = {
+    DBTYPE_POSTGRESQL: text("SELECT version()"),
+    DBTYPE_MYSQL: text("SELECT VERSION()"),
+    DBTYPE_SQLITE: text("SELECT sqlite_version()"),
+}
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -157,19 +169,12 @@ def test_session_scope(db):
 
     try:
         from dm_dbcore import session_scope
-        from sqlalchemy import text
 
         print("\n[4.1] Testing session_scope context manager...")
         with session_scope(db) as session:
             # Simple query to test connection
-            if db.database_type == 'postgresql':
-                result = session.execute(text("SELECT version()"))
-            elif db.database_type == 'mysql':
-                result = session.execute(text("SELECT VERSION()"))
-            elif db.database_type == 'sqlite':
-                result = session.execute(text("SELECT sqlite_version()"))
-            else:
-                result = None
+            statement = VERSION_SQL.get(db.database_type)
+            result = session.execute(statement) if statement is not None else None
 
             if result:
                 version = result.scalar()
@@ -202,20 +207,23 @@ def test_cache_management(db):
         return False
 
     try:
-        import pathlib
+        import os
 
-        cache_dir = pathlib.Path.home() / '.sqlalchemy_cache'
-        cache_file = cache_dir / 'test_metadata.pkl'
+        cache_file = os.path.join(os.path.expanduser('~'), '.sqlalchemy_cache', 'test_metadata.pkl')
 
         print(f"\n[5.1] Cache location: {cache_file}")
-        if cache_file.exists():
+        # A single os.stat answers both "does it exist?" and "when was it
+        # modified?" - half the syscalls of exists() followed by stat().
+        try:
+            st = os.stat(cache_file)
+        except FileNotFoundError:
+            print(f"    ⊗ Cache file not created yet")
+            print("    (Will be created on next startup)")
+        else:
             print(f"    ✓ Cache file exists")
             import datetime
-            mtime = datetime.datetime.fromtimestamp(cache_file.stat().st_mtime)
+            mtime = datetime.datetime.fromtimestamp(st.st_mtime)
             print(f"    Last modified: {mtime}")
-        else:
-            print(f"    ⊗ Cache file not created yet")
-            print("    (Will be created on next startup)")
 
         return True
 
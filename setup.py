@@ -44,6 +44,7 @@ setup(
         "postgresql": ["psycopg[binary]>=3.0"],
         "mysql": ["pymysql>=1.0.0"],
         "numpy": ["numpy>=1.20.0"],
+        "performance": ["msgpack>=1.0", "xxhash>=3.0"],
         "dev": ["pytest>=7.0", "black", "flake8"],
     },
     project_urls={
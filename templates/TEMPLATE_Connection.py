@@ -18,10 +18,22 @@
 
 import os
 import logging
+import functools
+from contextlib import asynccontextmanager
+from sqlalchemy import text
 from dm_dbcore import DatabaseConnection, session_scope, DBTYPE_POSTGRESQL, DBTYPE_MYSQL, DBTYPE_SQLITE
 
 logger = logging.getLogger(__name__)
 
+# Version query per database type, built once at import time. Reusing the
+# same TextClause instances guarantees compiled-statement cache hits instead
+# of constructing (and compiling) a fresh clause on every call.
+_VERSION_STMTS = {
+    DBTYPE_POSTGRESQL: text("SELECT version()"),
+    DBTYPE_MYSQL: text("SELECT VERSION()"),
+    DBTYPE_SQLITE: text("SELECT sqlite_version()"),
+}
+
 # =============================================================================
 # DATABASE CONNECTION CONFIGURATION
 # =============================================================================
@@ -70,14 +82,27 @@ METADATA_CACHE_FILENAME = 'MYPROJECT_metadata.pkl'
 # Set to False to disable caching (useful for development when schema changes frequently)
 USE_METADATA_CACHE = True
 
+# Cache paths resolved once at import time. Checking/removing the cache then
+# costs a single os-level call per file instead of repeated pathlib
+# construction plus separate exists()/stat() syscalls (each a round trip on
+# network filesystems).
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.sqlalchemy_cache')
+_CACHE_PATH = os.path.join(_CACHE_DIR, METADATA_CACHE_FILENAME)
+_HASH_PATH = os.path.splitext(_CACHE_PATH)[0] + '.hash'
+
 # =============================================================================
 # BUILD CONNECTION STRING
 # =============================================================================
 
+@functools.lru_cache(maxsize=1)
 def build_connection_string():
     """
     Build SQLAlchemy connection string based on database type.
 
+    The result is memoized: the environment lookup and string formatting run
+    once, so calling this per-request (e.g. from a web handler) costs a
+    cached function call rather than repeated os.environ reads.
+
     Returns:
         str: SQLAlchemy connection string
     """
@@ -110,13 +135,38 @@ def build_connection_string():
 # CONNECTION FACTORY FUNCTIONS
 # =============================================================================
 
+@functools.lru_cache(maxsize=1)
 def get_database_connection():
     """
     Get or create database connection (singleton pattern).
 
+    DatabaseConnection is itself a lock-protected singleton; the lru_cache
+    here just skips rebuilding the connection string on every call.
+
     On first call, creates the connection with connection string and cache.
     Subsequent calls return the existing connection.
 
+    NOTE: For PostgreSQL, dm-dbcore configures the engine to batch multi-row
+    INSERTs into pages of 1000 rows per statement (SQLAlchemy's
+    "insertmanyvalues" feature, the 2.0 equivalent of psycopg2's
+    execute_values). Bulk inserts through the ORM or Core get batched
+    automatically - no per-row INSERT round trips.
+
+    For very large PostgreSQL loads (millions of rows), use the COPY-based
+    helper instead of ORM inserts:
+
+        from dm_dbcore import copy_bulk_insert
+        with session_scope(db) as session:
+            copy_bulk_insert(session, 'myschema.mytable', rows, columns=['a', 'b'])
+
+    For reading large result sets, avoid `.all()` (which buffers every row
+    in memory) and iterate with the streaming helper instead:
+
+        from dm_dbcore import stream
+        with session_scope(db) as session:
+            for row in stream(session.query(MyTable), chunk=1000):
+                process(row)
+
     Returns:
         DatabaseConnection: Database connection instance
 
@@ -166,6 +216,73 @@ def get_session():
     return db.Session()
 
 
+# =============================================================================
+# READ-ONLY SESSION PATTERN
+# =============================================================================
+# Autoflush scans every object in the session for changes before EVERY
+# query - O(session size) per SELECT - and expire_on_commit invalidates all
+# loaded attributes at commit, forcing a fresh SELECT the next time any of
+# them is touched. Both are pure waste in read handlers. Turn them off for
+# read-heavy blocks:
+#
+#     with session_scope(db, autoflush=False, expire_on_commit=False) as session:
+#         users = session.query(User).all()
+#
+# WARNING: with autoflush off, pending writes are NOT visible to queries in
+# the same session until you call session.flush() explicitly.
+
+
+# =============================================================================
+# ASYNC CONNECTION (PostgreSQL only, optional)
+# =============================================================================
+# The synchronous driver handles one query per thread. For high-concurrency
+# scripts and async web frameworks, psycopg's async mode lets one process
+# multiplex many in-flight queries. prepare_threshold promotes any SQL reused
+# five or more times to a server-side prepared statement, so hot queries skip
+# parse/plan entirely.
+
+@functools.lru_cache(maxsize=1)
+def get_async_database_connection():
+    """
+    Get or create the async engine and session factory (built once).
+
+    Returns:
+        tuple: (AsyncEngine, async_sessionmaker)
+
+    Example:
+        >>> engine, _ = get_async_database_connection()
+        >>> async with session_scope_async() as session:
+        ...     result = await session.execute(text("SELECT 1"))
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    # The psycopg dialect serves both sync and async engines from the same
+    # 'postgresql+psycopg://' URL.
+    engine = create_async_engine(
+        build_connection_string(),
+        pool_size=20,
+        pool_pre_ping=True,
+        connect_args={'prepare_threshold': 5},
+    )
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    return engine, session_factory
+
+
+@asynccontextmanager
+async def session_scope_async():
+    """Async transactional scope; mirrors dm_dbcore.session_scope."""
+    _, session_factory = get_async_database_connection()
+    session = session_factory()
+    try:
+        yield session
+        await session.commit()
+    except:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
@@ -194,8 +311,6 @@ def test_connection():
     """
     db = get_database_connection()
 
-    from sqlalchemy import text
-
     info = {
         'database_type': db.database_type,
         'connected': False,
@@ -205,15 +320,9 @@ def test_connection():
 
     try:
         with session_scope(db) as session:
-            if db.database_type == DBTYPE_POSTGRESQL:
-                result = session.execute(text("SELECT version()"))
-                info['version'] = result.scalar()
-            elif db.database_type == DBTYPE_MYSQL:
-                result = session.execute(text("SELECT VERSION()"))
-                info['version'] = result.scalar()
-            elif db.database_type == DBTYPE_SQLITE:
-                result = session.execute(text("SELECT sqlite_version()"))
-                info['version'] = result.scalar()
+            statement = _VERSION_STMTS.get(db.database_type)
+            if statement is not None:
+                info['version'] = session.execute(statement).scalar()
 
             info['connected'] = True
 
@@ -233,23 +342,17 @@ def clear_metadata_cache():
     Returns:
         bool: True if cache was deleted or didn't exist
     """
-    import pathlib
-
-    cache_dir = pathlib.Path.home() / '.sqlalchemy_cache'
-    cache_file = cache_dir / METADATA_CACHE_FILENAME
-    hash_file = cache_file.with_suffix('.hash')  # MySQL only
-
     deleted = False
 
-    if cache_file.exists():
-        cache_file.unlink()
-        logger.info(f"Deleted metadata cache: {cache_file}")
-        deleted = True
-
-    if hash_file.exists():
-        hash_file.unlink()
-        logger.info(f"Deleted hash file: {hash_file}")
-        deleted = True
+    # Remove directly and let the OS report a missing file - one syscall
+    # per file instead of an exists() check followed by an unlink().
+    for path in (_CACHE_PATH, _HASH_PATH):
+        try:
+            os.remove(path)
+            logger.info(f"Deleted metadata cache file: {path}")
+            deleted = True
+        except FileNotFoundError:
+            pass
 
     if not deleted:
         logger.info("No cache file found to delete")
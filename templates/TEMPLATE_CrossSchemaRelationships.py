@@ -19,15 +19,22 @@
 # [ ] 6. Review PostgreSQL search_path handling (see notes below)
 # =============================================================================
 
+import os
+import pickle
 import logging
-from sqlalchemy import Column, Integer, String, ForeignKey
-from sqlalchemy.orm import relationship, configure_mappers
+from sqlalchemy import Column, Integer, String, ForeignKey, Table
+from sqlalchemy.orm import relationship
 from sqlalchemy.orm import registry
 
-from dm_dbcore import DatabaseConnection, session_scope
+from dm_dbcore import DatabaseConnection, session_scope, finalize_models
 
 logger = logging.getLogger(__name__)
 
+# Strict-loading toggle: set DMDBCORE_STRICT_LOADING=1 in dev/CI to turn any
+# accidental lazy relationship SELECT into an exception instead of a silent
+# N+1 query storm (see PITFALL 6 below). Unset, collections batch-load.
+_LAZY = 'raise_on_sql' if os.environ.get('DMDBCORE_STRICT_LOADING') else 'selectin'
+
 # =============================================================================
 # IMPORTANT: PostgreSQL search_path
 # =============================================================================
@@ -43,6 +50,23 @@ logger = logging.getLogger(__name__)
 #
 # =============================================================================
 
+# =============================================================================
+# TABLE REFLECTION
+# =============================================================================
+#
+# Table definitions are reflected from the database in ONE batched pass per
+# schema (see load_schema1_models/load_schema2_models below) rather than with
+# per-class 'autoload': True. Per-table autoload issues ~10 inspector queries
+# per table at import time; MetaData.reflect(schema=..., only=[...]) batches
+# the information_schema queries, so startup cost no longer scales with the
+# number of mapped classes.
+#
+# List here the tables each schema's models need, so reflection doesn't
+# prefetch the whole schema:
+
+SCHEMA1_TABLES = ['users', 'user_profiles', 'categories']
+SCHEMA2_TABLES = ['posts', 'comments', 'post_categories']
+
 # Create separate mapper registries for each schema (recommended)
 schema1_registry = registry()
 schema2_registry = registry()
@@ -60,18 +84,28 @@ class User:
     """
 
     __tablename__ = 'users'
-    __table_args__ = {'schema': 'SCHEMA1', 'autoload': True}
+    __table_args__ = {'schema': 'SCHEMA1'}
 
     # Primary key
     id = Column(Integer, primary_key=True)
 
     # ONE-TO-MANY cross-schema relationship: User -> Posts
+    #
+    # lazy='selectin' batches child loads into one "WHERE fk IN (...)" query
+    # per ~500 parents instead of one SELECT per parent (the N+1 problem).
+    # Opt out per-query with .options(lazyload(User.posts)) if a code path
+    # never touches the collection.
+    # DB-level delete cascade: the FK carries ON DELETE CASCADE and
+    # passive_deletes=True stops the ORM from SELECTing every child just to
+    # delete it row by row. Revert to cascade='all, delete-orphan' only if
+    # you depend on Python-side before_delete hooks.
     posts = relationship(
         'Post',                                    # Related class in schema2
         back_populates='author',                   # Corresponding attribute on Post
         foreign_keys='Post.author_id',             # Explicitly specify foreign key
-        lazy='select',
-        cascade='all, delete-orphan'
+        lazy=_LAZY,
+        cascade='save-update, merge',
+        passive_deletes=True
     )
 
     def __repr__(self):
@@ -87,14 +121,18 @@ class UserProfile:
     """
 
     __tablename__ = 'user_profiles'
-    __table_args__ = {'schema': 'SCHEMA1', 'autoload': True}
+    __table_args__ = {'schema': 'SCHEMA1'}
 
     id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, ForeignKey('SCHEMA1.users.id'), unique=True)
+    # Direct column reference: User is already defined, so this binds
+    # immediately (schema included) instead of deferring a string lookup
+    # to configure time
+    user_id = Column(Integer, ForeignKey(User.id, ondelete='CASCADE'), unique=True)
 
-    # ONE-TO-ONE relationship
+    # ONE-TO-ONE relationship - direct class reference (User is defined
+    # above) skips the string resolver pass in configure_mappers()
     user = relationship(
-        'User',
+        User,
         backref='profile',           # Creates User.profile attribute
         uselist=False                # ONE-TO-ONE (not a list)
     )
@@ -116,28 +154,36 @@ class Post:
     """
 
     __tablename__ = 'posts'
-    __table_args__ = {'schema': 'SCHEMA2', 'autoload': True}
+    __table_args__ = {'schema': 'SCHEMA2'}
 
     # Primary key
     id = Column(Integer, primary_key=True)
 
-    # IMPORTANT: Foreign key MUST include schema name!
-    author_id = Column(Integer, ForeignKey('SCHEMA1.users.id'))
+    # Cross-schema foreign key via direct column reference - the schema
+    # name travels with the Column, and binding happens now rather than in
+    # a second resolution pass inside configure_mappers(). (If you use the
+    # string form instead, it MUST include the schema name:
+    # ForeignKey('SCHEMA1.users.id').)
+    author_id = Column(Integer, ForeignKey(User.id, ondelete='CASCADE'))
 
     # MANY-TO-ONE cross-schema relationship: Post -> User
+    #
+    # Scalar many-to-one sides are cheapest as a join folded into the parent
+    # query ('joined') rather than an extra SELECT per post.
     author = relationship(
-        'User',                                    # Related class in schema1
+        User,                                      # Direct reference works across registries too
         back_populates='posts',                    # Corresponding attribute on User
         foreign_keys=[author_id],                  # Explicitly specify foreign key
-        lazy='select'
+        lazy='joined'
     )
 
     # ONE-TO-MANY same-schema relationship: Post -> Comments
     comments = relationship(
         'Comment',
         back_populates='post',
-        lazy='select',
-        cascade='all, delete-orphan'
+        lazy=_LAZY,
+        cascade='save-update, merge',
+        passive_deletes=True
     )
 
     def __repr__(self):
@@ -153,26 +199,26 @@ class Comment:
     """
 
     __tablename__ = 'comments'
-    __table_args__ = {'schema': 'SCHEMA2', 'autoload': True}
+    __table_args__ = {'schema': 'SCHEMA2'}
 
     id = Column(Integer, primary_key=True)
 
-    # Foreign key to Post (same schema)
-    post_id = Column(Integer, ForeignKey('SCHEMA2.posts.id'))
+    # Foreign key to Post (same schema) - direct reference, Post is defined
+    post_id = Column(Integer, ForeignKey(Post.id, ondelete='CASCADE'))
 
-    # Foreign key to User (cross-schema) - MUST include schema name!
-    author_id = Column(Integer, ForeignKey('SCHEMA1.users.id'))
+    # Foreign key to User (cross-schema) - direct reference carries the schema
+    author_id = Column(Integer, ForeignKey(User.id))
 
     # Relationships
     post = relationship(
-        'Post',
+        Post,
         back_populates='comments'
     )
 
     author = relationship(
-        'User',
+        User,
         foreign_keys=[author_id],
-        lazy='select'
+        lazy='joined'
     )
 
     def __repr__(self):
@@ -183,14 +229,15 @@ class Comment:
 # EXAMPLE: Cross-Schema Many-to-Many Relationship
 # =============================================================================
 
-from sqlalchemy import Table
-
 # Association table in schema2 linking posts to categories in schema1
 post_categories_association = Table(
     'post_categories',
     schema2_registry.metadata,
-    # Note: Foreign keys MUST include schema names!
-    Column('post_id', Integer, ForeignKey('SCHEMA2.posts.id'), primary_key=True),
+    # Post is defined above, so reference its column directly. Category is
+    # defined BELOW this table, so its foreign key must stay a string -
+    # schema-qualified! - and resolve late. Keep the string form only for
+    # such genuinely circular definition orders.
+    Column('post_id', Integer, ForeignKey(Post.id), primary_key=True),
     Column('category_id', Integer, ForeignKey('SCHEMA1.categories.id'), primary_key=True),
     schema='SCHEMA2'
 )
@@ -201,16 +248,21 @@ class Category:
     """Category model in schema1."""
 
     __tablename__ = 'categories'
-    __table_args__ = {'schema': 'SCHEMA1', 'autoload': True}
+    __table_args__ = {'schema': 'SCHEMA1'}
 
     id = Column(Integer, primary_key=True)
 
     # MANY-TO-MANY cross-schema relationship
+    #
+    # selectin loading works through the association table too: one query
+    # against post_categories WHERE category_id IN (...) plus one against
+    # posts WHERE id IN (...), instead of a join per category. Note that
+    # collection writes must be flushed before the batched load sees them.
     posts = relationship(
-        'Post',
+        Post,
         secondary=post_categories_association,
         back_populates='categories',
-        lazy='select'
+        lazy=_LAZY
     )
 
     def __repr__(self):
@@ -224,7 +276,7 @@ class Category:
 #     'Category',
 #     secondary=post_categories_association,
 #     back_populates='posts',
-#     lazy='select'
+#     lazy=_LAZY
 # )
 
 
@@ -235,6 +287,8 @@ class Category:
 # PITFALL 1: Forgetting schema name in ForeignKey
 # ✗ WRONG:  ForeignKey('users.id')
 # ✓ RIGHT:  ForeignKey('SCHEMA1.users.id')
+# ✓ BEST:   ForeignKey(User.id) - direct reference, schema comes along free
+#           (only possible when the referenced class is defined first)
 #
 # PITFALL 2: Circular imports between schema modules
 # SOLUTION: Import model classes within functions, not at module level
@@ -251,6 +305,13 @@ class Category:
 # PITFALL 5: Metadata not properly shared between registries
 # SOLUTION: Use separate registries per schema, bind both to same engine
 #
+# PITFALL 6: N+1 regressions sneaking past review
+# SOLUTION: Run dev/CI with DMDBCORE_STRICT_LOADING=1 so collection
+#           relationships use lazy='raise_on_sql' - any relationship access
+#           that would emit a lazy SELECT raises instead. For individual
+#           queries, combine selectinload() with raiseload('*'):
+#           stmt.options(selectinload(User.posts), raiseload('*'))
+#
 # =============================================================================
 
 
@@ -258,9 +319,80 @@ class Category:
 # LOADING FUNCTIONS
 # =============================================================================
 
+# Reflected table definitions are cached on disk alongside dm-dbcore's own
+# metadata cache, so a warm start rebuilds them with zero database round
+# trips. Delete the cache file (or call clear_metadata_cache() in your
+# connection module) after schema DDL changes.
+_REFLECTION_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.sqlalchemy_cache')
+
+
+def _reflect_once(metadata, engine, schema, table_names, cache_name):
+    """
+    Reflect one schema's tables into `metadata`, hydrating from a disk
+    cache when possible.
+
+    Cache hit: table definitions are rebuilt from the cached dict without
+    touching the database. Cache miss (or unreadable cache): reflection runs
+    in one batched pass and the cache is written for next time.
+
+    Args:
+        metadata: the registry's MetaData to populate
+        engine: SQLAlchemy engine to reflect from on a cache miss
+        schema: schema name to reflect
+        table_names: list of table names the models need
+        cache_name: cache filename (stored under ~/.sqlalchemy_cache/)
+    """
+    from dm_dbcore.DatabaseConnection import MetadataCache
+
+    cache_path = os.path.join(_REFLECTION_CACHE_DIR, cache_name)
+
+    try:
+        with open(cache_path, 'rb') as f:
+            table_defs = pickle.load(f)
+        for table_def in table_defs.values():
+            columns = []
+            for name, type_str, nullable, primary_key, fk_target in table_def['columns']:
+                args = [name, MetadataCache._resolve_type(type_str)]
+                if fk_target:
+                    args.append(ForeignKey(fk_target))
+                columns.append(Column(*args, nullable=nullable, primary_key=primary_key))
+            # extend_existing merges the cached columns into the partially
+            # declared Table created by the mapped class
+            Table(table_def['name'], metadata, *columns,
+                  schema=table_def['schema'], extend_existing=True)
+        logger.info("Loaded %s table definitions from cache: %s", schema, cache_path)
+        return
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    metadata.reflect(
+        bind=engine,
+        schema=schema,
+        only=table_names,
+        views=True,
+        extend_existing=True
+    )
+
+    table_defs = {key: table_def
+                  for key, table_def in MetadataCache._metadata_to_dict(metadata).items()
+                  if table_def['schema'] == schema}
+    try:
+        os.makedirs(_REFLECTION_CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(table_defs, f)
+    except OSError:
+        pass
+
+
+# Idempotence guards: loading is a startup cost, re-entry is O(1)
+_schema1_loaded = False
+_schema2_loaded = False
+_models_loaded = False
+
+
 def load_schema1_models(dbc):
     """
-    Load and validate schema1 model classes.
+    Load and validate schema1 model classes. Idempotent.
 
     Args:
         dbc: DatabaseConnection instance
@@ -268,19 +400,34 @@ def load_schema1_models(dbc):
     Returns:
         bool: True if successful
     """
+    global _schema1_loaded
+    if _schema1_loaded:
+        return True
     try:
-        schema1_registry.metadata.bind = dbc.engine
+        # Reflect all of this schema's tables in one batched pass (instead
+        # of one autoload round-trip storm per mapped class), hydrating
+        # from the disk cache when possible.
+        _reflect_once(
+            schema1_registry.metadata,
+            dbc.engine,
+            schema='SCHEMA1',
+            table_names=SCHEMA1_TABLES,
+            cache_name='MYPROJECT_schema1_tables.pkl'
+        )
         # Don't configure_mappers() yet - wait for all schemas
+        _schema1_loaded = True
         logger.info("SCHEMA1 models loaded")
         return True
-    except Exception as e:
-        logger.error(f"Failed to load SCHEMA1 models: {e}")
+    except Exception:
+        # %s-style args defer formatting until a handler accepts the record,
+        # and exc_info captures the traceback in the log instead of stderr
+        logger.error("Failed to load %s models", 'SCHEMA1', exc_info=True)
         return False
 
 
 def load_schema2_models(dbc):
     """
-    Load and validate schema2 model classes.
+    Load and validate schema2 model classes. Idempotent.
 
     Args:
         dbc: DatabaseConnection instance
@@ -288,19 +435,61 @@ def load_schema2_models(dbc):
     Returns:
         bool: True if successful
     """
+    global _schema2_loaded
+    if _schema2_loaded:
+        return True
     try:
-        schema2_registry.metadata.bind = dbc.engine
+        # Reflect all of this schema's tables in one batched pass (instead
+        # of one autoload round-trip storm per mapped class), hydrating
+        # from the disk cache when possible.
+        _reflect_once(
+            schema2_registry.metadata,
+            dbc.engine,
+            schema='SCHEMA2',
+            table_names=SCHEMA2_TABLES,
+            cache_name='MYPROJECT_schema2_tables.pkl'
+        )
         # Don't configure_mappers() yet - wait for all schemas
+        _schema2_loaded = True
         logger.info("SCHEMA2 models loaded")
         return True
-    except Exception as e:
-        logger.error(f"Failed to load SCHEMA2 models: {e}")
+    except Exception:
+        logger.error("Failed to load %s models", 'SCHEMA2', exc_info=True)
         return False
 
 
+# NOTE ON IDENTITY-MAP REUSE: no hook is needed for it. ORM SELECTs
+# already skip re-hydrating rows whose primary key is present in the
+# session (populate_existing=False is the default), so overlapping graphs
+# - the same Post reached via Category.posts and via User.posts - cost
+# O(unique rows) of attribute hydration out of the box. Only pass
+# populate_existing=True when stale rows must be refreshed from the
+# database.
+
+
+def _build_lookup_statements():
+    """
+    Pre-build the common by-primary-key lookup statement for each model.
+
+    Re-executing the SAME statement object means every execution after
+    the first is a hit in the engine's compiled-statement cache; only the
+    very first execution pays the ~1-3 ms compilation cost (the cache is
+    keyed at execute time, so it cannot be warmed without running the
+    statement). Readers use:
+
+        session.execute(Post.__dmdbcore_by_id__, {'id': 42}).scalar_one()
+    """
+    from sqlalchemy import select, bindparam
+
+    for cls in (User, UserProfile, Post, Comment, Category):
+        cls.__dmdbcore_by_id__ = select(cls).where(cls.id == bindparam('id'))
+
+
 def load_all_models_with_relationships(dbc):
     """
     Load all model classes and configure cross-schema relationships.
+    Idempotent - safe to call from every entry point; only the first call
+    does work.
 
     IMPORTANT: This must be called AFTER all individual schema loaders.
 
@@ -310,6 +499,9 @@ def load_all_models_with_relationships(dbc):
     Returns:
         bool: True if successful
     """
+    global _models_loaded
+    if _models_loaded:
+        return True
     try:
         # Load both schemas
         if not load_schema1_models(dbc):
@@ -317,16 +509,23 @@ def load_all_models_with_relationships(dbc):
         if not load_schema2_models(dbc):
             return False
 
-        # NOW configure all mappers and relationships
-        configure_mappers()
+        # NOW configure all mappers and relationships - one pass for every
+        # registry that registered itself, instead of one per module
+        finalize_models()
+
+        # Allow the batched category->posts load to fire for pending
+        # (not-yet-flushed) Category instances as well
+        Category.__mapper__.relationships['posts'].load_on_pending = True
+
+        # Build the reusable by-id lookup statements while we're at startup
+        _build_lookup_statements()
 
+        _models_loaded = True
         logger.info("All cross-schema relationships configured")
         return True
 
-    except Exception as e:
-        logger.error(f"Failed to configure cross-schema relationships: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.error("Failed to configure cross-schema relationships", exc_info=True)
         return False
 
 
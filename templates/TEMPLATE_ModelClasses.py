@@ -18,15 +18,26 @@
 # [ ] 8. For cross-schema relationships, see TEMPLATE_CrossSchemaRelationships.py
 # =============================================================================
 
+import os
 import logging
 from sqlalchemy import Column, Integer, String, ForeignKey, Table
-from sqlalchemy.orm import relationship, configure_mappers
+from sqlalchemy.orm import relationship
 
 # Import dm-dbcore components
-from dm_dbcore import DatabaseConnection, session_scope
+from dm_dbcore import DatabaseConnection, session_scope, register_models
 
 logger = logging.getLogger(__name__)
 
+# =============================================================================
+# STRICT LOADING TOGGLE
+# =============================================================================
+# Set DMDBCORE_STRICT_LOADING=1 in dev/CI to turn any accidental lazy
+# relationship SELECT into an exception instead of a silent N+1 query storm.
+# Unset (production) this is plain batched selectin loading - zero runtime
+# cost either way.
+
+_LAZY = 'raise_on_sql' if os.environ.get('DMDBCORE_STRICT_LOADING') else 'selectin'
+
 # =============================================================================
 # MAPPER REGISTRY SETUP
 # =============================================================================
@@ -44,17 +55,19 @@ class MyTable:
     """
     Example model class for a database table.
 
-    This class uses SQLAlchemy's autoload feature to reflect the table structure
-    from the database, so you don't need to define every column manually.
+    Declare the primary key (and any columns you reference from Python)
+    explicitly; remaining columns can be merged in at runtime with a single
+    batched metadata.reflect() pass if needed (see the PostgreSQL template's
+    _reflect_once helper).
 
-    IMPORTANT: The table must exist in the database before loading this class!
+    IMPORTANT: The table must exist in the database before querying this class!
     """
 
     # ------------------------------------------------------------------
     # TODO: Update these for your table
     # ------------------------------------------------------------------
     __tablename__ = 'my_table'           # Table name in database
-    __table_args__ = {'schema': 'MYSCHEMA', 'autoload': True}
+    __table_args__ = {'schema': 'MYSCHEMA'}
 
     # ------------------------------------------------------------------
     # Primary Key (required)
@@ -63,10 +76,10 @@ class MyTable:
     id = Column(Integer, primary_key=True)
 
     # ------------------------------------------------------------------
-    # Additional Columns (optional - only if not autoloaded)
+    # Additional Columns
     # ------------------------------------------------------------------
-    # If autoload=True, you don't need to define columns unless you want
-    # to override the autoloaded definition or add relationships
+    # Define the columns you access from Python; columns merged in by
+    # reflection don't need to be repeated here
 
     # name = Column(String(100))  # Example: explicit column definition
 
@@ -80,7 +93,7 @@ class MyTable:
     # posts = relationship(
     #     'Post',                          # Related model class name
     #     back_populates='user',           # Corresponding attribute on Post
-    #     lazy='select',                   # Loading strategy: 'select', 'joined', 'subquery', 'dynamic'
+    #     lazy=_LAZY,                      # Loading strategy (see toggle above)
     #     cascade='all, delete-orphan'     # Cascade behavior for deletes
     # )
 
@@ -117,16 +130,23 @@ class User:
     """Example: User model (the 'one' side of 1:N relationship)."""
 
     __tablename__ = 'users'
-    __table_args__ = {'schema': 'MYSCHEMA', 'autoload': True}
+    __table_args__ = {'schema': 'MYSCHEMA'}
 
     id = Column(Integer, primary_key=True)
 
     # ONE-TO-MANY: One user has many posts
+    #
+    # DB-level delete cascade: the FK carries ON DELETE CASCADE and
+    # passive_deletes=True stops the ORM from SELECTing every child just to
+    # delete it row by row - one parent DELETE ripples through inside the
+    # database. If you rely on Python-side delete hooks (before_delete
+    # events), move that logic to DB triggers or revert per relationship.
     posts = relationship(
         'Post',
         back_populates='user',
-        lazy='select',                    # Load posts when accessed
-        cascade='all, delete-orphan'      # Delete posts when user is deleted
+        lazy=_LAZY,                       # Batch-load posts with one IN query (avoids N+1)
+        cascade='save-update, merge',
+        passive_deletes=True
     )
 
     def __repr__(self):
@@ -138,15 +158,25 @@ class Post:
     """Example: Post model (the 'many' side of N:1 relationship)."""
 
     __tablename__ = 'posts'
-    __table_args__ = {'schema': 'MYSCHEMA', 'autoload': True}
+    __table_args__ = {'schema': 'MYSCHEMA'}
 
     id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, ForeignKey('MYSCHEMA.users.id'))
+    user_id = Column(Integer, ForeignKey('MYSCHEMA.users.id', ondelete='CASCADE'))
 
     # MANY-TO-ONE: Many posts belong to one user
+    #
+    # Scalar many-to-one targets that are read on nearly every access are
+    # cheapest folded into the parent query as a join (one query, no extra
+    # SELECT per post). Add innerjoin=True when the FK is NOT NULL - inner
+    # joins plan better than outer. Do NOT apply 'joined' to collection
+    # sides: the join multiplies parent rows per child.
+    # Direct class reference (User is defined above): skips the string
+    # resolver pass in configure_mappers(). Use the string form only when
+    # the class is defined later in the module.
     user = relationship(
-        'User',
-        back_populates='posts'
+        User,
+        back_populates='posts',
+        lazy='joined'
     )
 
     def __repr__(self):
@@ -173,16 +203,16 @@ class Tag:
     """Example: Tag model for many-to-many relationship."""
 
     __tablename__ = 'tags'
-    __table_args__ = {'schema': 'MYSCHEMA', 'autoload': True}
+    __table_args__ = {'schema': 'MYSCHEMA'}
 
     id = Column(Integer, primary_key=True)
 
     # MANY-TO-MANY: Tags can be on many posts, posts can have many tags
     posts = relationship(
-        'Post',
+        Post,                             # Direct reference - Post is defined above
         secondary=post_tags_association,  # Association table
         back_populates='tags',
-        lazy='select'
+        lazy=_LAZY
     )
 
     def __repr__(self):
@@ -196,7 +226,7 @@ class Tag:
 #     'Tag',
 #     secondary=post_tags_association,
 #     back_populates='posts',
-#     lazy='select'
+#     lazy=_LAZY
 # )
 
 
@@ -207,11 +237,57 @@ class Tag:
 # lazy='select'        - Load related objects on access (default, N+1 queries)
 # lazy='joined'        - Load related objects with JOIN in same query
 # lazy='subquery'      - Load related objects with subquery
-# lazy='dynamic'       - Return Query object instead of loading (for large collections)
+# lazy='write_only'    - Never load implicitly; read via explicit select() (for large collections)
 # lazy='selectin'      - Use SELECT IN to load related objects (good for collections)
 # lazy='noload'        - Never load related objects
 # lazy='raise'         - Raise exception if accessed (force explicit loading)
 #
+# The templates default collection relationships to lazy='selectin': accessing
+# e.g. user.posts for N users costs one batched `WHERE user_id IN (...)` query
+# instead of N separate SELECTs. For a specific query you can still override
+# per call:
+#
+#     from sqlalchemy.orm import selectinload
+#     session.query(User).options(selectinload(User.posts))
+#
+# For unbounded collections (audit logs, event streams) use
+# lazy='write_only': the attribute becomes a WriteOnlyCollection that never
+# loads implicitly - len(user.audit_events) raises instead of fetching the
+# whole table - and reads are explicit, paginated 2.0-style statements:
+#
+#     audit_events = relationship('AuditEvent', lazy='write_only')
+#
+#     stmt = user.audit_events.select().limit(100)
+#     events = session.scalars(stmt).all()
+#
+# (Requires SQLAlchemy >= 2.0, which dm-dbcore already targets. The legacy
+# lazy='dynamic' strategy returns a Query object that cannot participate in
+# selectin batching and always round-trips - prefer write_only.)
+#
+# JOIN-AND-FILTER + EAGER LOAD: when a query already joins to filter,
+# adding joinedload() emits a SECOND join of the same table. Use
+# contains_eager() to reuse the filter join for collection population:
+#
+#     stmt = (
+#         select(User)
+#         .join(User.posts)
+#         .where(Post.published == True)
+#         .options(contains_eager(User.posts))
+#     )
+#
+# contains_eager() must match the join target exactly - when the join uses
+# an alias (e.g. self-joins), pass it through of_type():
+#
+#     published = aliased(Post)
+#     stmt = (
+#         select(User)
+#         .join(User.posts.of_type(published))
+#         .where(published.published == True)
+#         .options(contains_eager(User.posts.of_type(published)))
+#     )
+#
+# NOTE: the loaded collection then holds only the rows the filter matched.
+#
 # =============================================================================
 
 
@@ -223,26 +299,106 @@ class Tag:
 # cascade='save-update'          - Only save/update cascades (default)
 # cascade='delete'               - Deletion cascades
 # cascade='delete-orphan'        - Delete orphaned objects
-# cascade='all, delete-orphan'   - Common pattern for owned relationships
+# cascade='all, delete-orphan'   - Python-side delete of owned children (slow)
 # cascade='merge'                - Merge operations cascade
 # cascade='refresh-expire'       - Refresh/expire operations cascade
 #
+# PERFORMANCE: Python-side delete cascades SELECT every child row and delete
+# them one by one. Prefer DB-level ON DELETE CASCADE on the FK plus
+# passive_deletes=True on the relationship (as User.posts above does): one
+# DELETE ripples through inside the database. Keep Python cascades only when
+# you depend on per-row delete hooks (before_delete events).
+#
+# =============================================================================
+
+
+# =============================================================================
+# INHERITANCE + POLYMORPHIC LOADING (Optional)
 # =============================================================================
+# Joined-table inheritance example. The key performance setting is
+# 'polymorphic_load': 'selectin' on each subclass: fetching a mixed
+# collection of the base class batches each subclass's extra columns into
+# ONE IN query per subclass, instead of one query per row - and removes
+# the need for with_polymorphic('*', ...) at query sites.
+
+# from sqlalchemy import String
+#
+# @mapper_registry.mapped
+# class Notification:
+#     """Base notification - rows discriminated by 'kind'."""
+#
+#     __tablename__ = 'notifications'
+#     __table_args__ = {'schema': 'MYSCHEMA'}
+#
+#     id = Column(Integer, primary_key=True)
+#     kind = Column(String(20), nullable=False)
+#
+#     __mapper_args__ = {
+#         'polymorphic_on': kind,
+#         'polymorphic_identity': 'base',
+#     }
+#
+#
+# class EmailNotification(Notification):
+#     __tablename__ = 'email_notifications'
+#     __table_args__ = {'schema': 'MYSCHEMA'}
+#
+#     id = Column(Integer, ForeignKey('MYSCHEMA.notifications.id'), primary_key=True)
+#
+#     __mapper_args__ = {
+#         'polymorphic_identity': 'email',
+#         'polymorphic_load': 'selectin',    # batch subclass column loads
+#     }
+#
+#
+# class SMSNotification(Notification):
+#     __tablename__ = 'sms_notifications'
+#     __table_args__ = {'schema': 'MYSCHEMA'}
+#
+#     id = Column(Integer, ForeignKey('MYSCHEMA.notifications.id'), primary_key=True)
+#
+#     __mapper_args__ = {
+#         'polymorphic_identity': 'sms',
+#         'polymorphic_load': 'selectin',
+#     }
+
+
+# =============================================================================
+# STRICT QUERY HELPER
+# =============================================================================
+
+def strict_query(stmt, *loads):
+    """
+    Eagerly load the listed relationships and forbid all other lazy loads.
+
+    Relationships not listed raise InvalidRequestError instead of silently
+    emitting one SELECT per row, so N+1 regressions fail fast in tests:
+
+        stmt = strict_query(select(User), User.posts)
+        users = session.scalars(stmt).all()
+    """
+    from sqlalchemy.orm import selectinload, raiseload
+    return stmt.options(*[selectinload(load) for load in loads], raiseload('*'))
 
 
 # =============================================================================
 # FINALIZE MODEL CLASSES
 # =============================================================================
 #
-# Model classes are configured automatically via the @mapper_registry.mapped
-# decorator when this module is imported. The configure_mappers() call below
-# validates all relationships are properly configured.
+# Model classes are mapped via the @mapper_registry.mapped decorator when
+# this module is imported. Relationship configuration is DEFERRED: the
+# register_models() call below records this registry, and the application
+# calls dm_dbcore.finalize_models() once after all model modules are
+# imported. This avoids re-walking the full mapper graph per module
+# (configure_mappers() is O(all relationships) on every call).
 #
-# No explicit load function is needed. Simply import your model classes:
+# Simply import your model classes, then finalize once at startup:
 #   from myproject_models import User, Post
+#   import dm_dbcore
+#   dm_dbcore.finalize_models()
 # =============================================================================
 
-# Validate all mapper relationships
-configure_mappers()
+# Defer relationship validation to dm_dbcore.finalize_models()
+register_models(mapper_registry)
 
-logger.info("MYSCHEMA model classes configured successfully")
+logger.info("MYSCHEMA model classes registered")
@@ -17,14 +17,42 @@
 # [ ] 7. Test with main() function
 # =============================================================================
 
+import os
 import logging
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Table
-from sqlalchemy.orm import relationship, configure_mappers, registry
+from sqlalchemy import Column, Integer, BigInteger, SmallInteger, String, Text, DateTime, Boolean, ForeignKey, Table
+from sqlalchemy.orm import relationship, registry
 
-from dm_dbcore import DatabaseConnection, session_scope
+from dm_dbcore import DatabaseConnection, session_scope, register_models
 
 logger = logging.getLogger(__name__)
 
+# =============================================================================
+# STRICT LOADING TOGGLE
+# =============================================================================
+# Set DMDBCORE_STRICT_LOADING=1 in dev/CI to turn any accidental lazy
+# relationship SELECT into an exception instead of a silent N+1 query storm.
+# Unset (production) this is plain batched selectin loading - zero runtime
+# cost either way.
+
+_LAZY = 'raise_on_sql' if os.environ.get('DMDBCORE_STRICT_LOADING') else 'selectin'
+
+# =============================================================================
+# KEY COLUMN SIZING
+# =============================================================================
+# Right-size key columns: every byte of a key is paid again in every index
+# page, every FK column and every selectin IN-list. Growing fact tables
+# (posts, comments) want BigInteger (8 bytes) before they overflow Integer;
+# small lookup tables (tags, statuses - hundreds to thousands of rows) fit
+# SmallInteger (2 bytes). Example: a post_tags row keyed BIGINT + SMALLINT
+# carries 10 bytes of keys vs 16 for two BIGINTs - fewer index pages and
+# better cache hit rates on memory-bound index scans. For lookup FKs MySQL
+# also offers SMALLINT UNSIGNED (sqlalchemy.dialects.mysql.SMALLINT with
+# unsigned=True) to double the usable range.
+
+PK_TYPE = BigInteger         # primary keys on growing tables
+FK_TYPE = BigInteger         # foreign keys referencing those primary keys
+TAG_KEY_TYPE = SmallInteger  # keys for small lookup tables (< ~32k rows)
+
 # =============================================================================
 # MYSQL DATABASE STRUCTURE
 # =============================================================================
@@ -59,14 +87,13 @@ mapper_registry = registry()
 # MySQL supports different features than PostgreSQL:
 #
 # 1. NO SCHEMAS - Database name is in connection string, not table definition
-#    __table_args__ = {'autoload': True}  # NO 'schema' parameter!
+#    __table_args__ = {'mysql_engine': 'InnoDB'}  # NO 'schema' parameter!
 #
 # 2. STORAGE ENGINES - InnoDB (default), MyISAM
-#    __table_args__ = {'autoload': True, 'mysql_engine': 'InnoDB'}
+#    __table_args__ = {'mysql_engine': 'InnoDB'}
 #
 # 3. CHARACTER SETS - utf8mb4 recommended
 #    __table_args__ = {
-#        'autoload': True,
 #        'mysql_charset': 'utf8mb4',
 #        'mysql_collate': 'utf8mb4_unicode_ci'
 #    }
@@ -87,7 +114,7 @@ mapper_registry = registry()
 #    from sqlalchemy import Index
 #    __table_args__ = (
 #        Index('idx_fulltext_title', 'title', mysql_prefix='FULLTEXT'),
-#        {'autoload': True}
+#        {'mysql_engine': 'InnoDB'}
 #    )
 #
 # =============================================================================
@@ -111,28 +138,35 @@ class User:
 
     __tablename__ = 'users'
     __table_args__ = {
-        'autoload': True,
         'mysql_engine': 'InnoDB',           # Storage engine (default)
         'mysql_charset': 'utf8mb4',         # Character set
         'mysql_collate': 'utf8mb4_unicode_ci'  # Collation
     }
 
     # Primary key (required)
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(PK_TYPE, primary_key=True, autoincrement=True)
 
     # Relationships
+    #
+    # DB-level delete cascade: the FK carries ON DELETE CASCADE and
+    # passive_deletes=True stops the ORM from SELECTing every child just to
+    # delete it row by row - one parent DELETE ripples through inside the
+    # database. If you rely on Python-side delete hooks (before_delete
+    # events), move that logic to DB triggers or revert per relationship.
     posts = relationship(
         'Post',
         back_populates='author',
-        lazy='select',
-        cascade='all, delete-orphan'
+        lazy=_LAZY,
+        cascade='save-update, merge',
+        passive_deletes=True
     )
 
     profile = relationship(
         'UserProfile',
         back_populates='user',
         uselist=False,  # One-to-one
-        cascade='all, delete-orphan'
+        cascade='save-update, merge',
+        passive_deletes=True
     )
 
     def __repr__(self):
@@ -147,18 +181,23 @@ class UserProfile:
 
     __tablename__ = 'user_profiles'
     __table_args__ = {
-        'autoload': True,
         'mysql_engine': 'InnoDB',
         'mysql_charset': 'utf8mb4'
     }
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey('users.id'), unique=True, nullable=False)
+    id = Column(PK_TYPE, primary_key=True, autoincrement=True)
+    user_id = Column(FK_TYPE, ForeignKey('users.id', ondelete='CASCADE'), unique=True, nullable=False)
 
-    # One-to-one relationship
+    # One-to-one relationship - joined inner join: the FK is NOT NULL, so
+    # the user row comes back in the same query as the profile
+    # Direct class reference (User is defined above) skips the string
+    # resolver pass in configure_mappers(); keep strings only for classes
+    # defined later in the module
     user = relationship(
-        'User',
-        back_populates='profile'
+        User,
+        back_populates='profile',
+        lazy='joined',
+        innerjoin=True
     )
 
     def __repr__(self):
@@ -173,32 +212,39 @@ class Post:
 
     __tablename__ = 'posts'
     __table_args__ = {
-        'autoload': True,
         'mysql_engine': 'InnoDB',
         'mysql_charset': 'utf8mb4'
     }
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    author_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    id = Column(PK_TYPE, primary_key=True, autoincrement=True)
+    author_id = Column(FK_TYPE, ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
 
     # Relationships
+    #
+    # Scalar many-to-one sides load cheapest as a join folded into the
+    # parent query (innerjoin=True is valid because the FK is NOT NULL).
+    # Keep collections on selectin - 'joined' on a collection multiplies
+    # parent rows per child.
     author = relationship(
-        'User',
-        back_populates='posts'
+        User,
+        back_populates='posts',
+        lazy='joined',
+        innerjoin=True
     )
 
     comments = relationship(
         'Comment',
         back_populates='post',
-        lazy='select',
-        cascade='all, delete-orphan'
+        lazy=_LAZY,
+        cascade='save-update, merge',
+        passive_deletes=True
     )
 
     tags = relationship(
         'Tag',
         secondary=lambda: post_tags_association,
         back_populates='posts',
-        lazy='select'
+        lazy=_LAZY
     )
 
     def __repr__(self):
@@ -213,22 +259,25 @@ class Comment:
 
     __tablename__ = 'comments'
     __table_args__ = {
-        'autoload': True,
         'mysql_engine': 'InnoDB'
     }
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    post_id = Column(Integer, ForeignKey('posts.id'), nullable=False)
-    author_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    id = Column(PK_TYPE, primary_key=True, autoincrement=True)
+    post_id = Column(FK_TYPE, ForeignKey('posts.id', ondelete='CASCADE'), nullable=False)
+    author_id = Column(FK_TYPE, ForeignKey('users.id'), nullable=False)
 
     post = relationship(
-        'Post',
-        back_populates='comments'
+        Post,
+        back_populates='comments',
+        lazy='joined',
+        innerjoin=True
     )
 
     author = relationship(
-        'User',
-        foreign_keys=[author_id]
+        User,
+        foreign_keys=[author_id],
+        lazy='joined',
+        innerjoin=True
     )
 
     def __repr__(self):
@@ -244,10 +293,12 @@ class Comment:
 post_tags_association = Table(
     'post_tags',
     mapper_registry.metadata,
-    Column('post_id', Integer, ForeignKey('posts.id'), primary_key=True),
-    Column('tag_id', Integer, ForeignKey('tags.id'), primary_key=True),
+    Column('post_id', FK_TYPE, ForeignKey('posts.id'), primary_key=True),
+    Column('tag_id', TAG_KEY_TYPE, ForeignKey('tags.id'), primary_key=True),
     mysql_engine='InnoDB',
-    mysql_charset='utf8mb4'
+    mysql_charset='utf8mb4',
+    # association rows are pure keys - compression pays off here
+    mysql_row_format='COMPRESSED'
 )
 
 
@@ -257,23 +308,43 @@ class Tag:
 
     __tablename__ = 'tags'
     __table_args__ = {
-        'autoload': True,
         'mysql_engine': 'InnoDB'
     }
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    # Small lookup table: SmallInteger halves the bytes in every post_tags
+    # index entry that references it
+    id = Column(TAG_KEY_TYPE, primary_key=True, autoincrement=True)
 
     posts = relationship(
-        'Post',
+        Post,
         secondary=post_tags_association,
         back_populates='tags',
-        lazy='select'
+        lazy=_LAZY
     )
 
     def __repr__(self):
         return f"<Tag(id={self.id})>"
 
 
+# =============================================================================
+# LARGE COLLECTIONS: lazy='write_only'
+# =============================================================================
+# For unbounded collections (audit logs, event streams) use
+# lazy='write_only': the attribute becomes a WriteOnlyCollection that never
+# loads implicitly - len(user.audit_events) raises instead of fetching the
+# whole table - and reads are explicit, paginated 2.0-style statements:
+#
+#     audit_events = relationship('AuditEvent', lazy='write_only')
+#
+#     stmt = user.audit_events.select().limit(100)
+#     events = session.scalars(stmt).all()
+#
+# (Requires SQLAlchemy >= 2.0, which dm-dbcore already targets. The legacy
+# lazy='dynamic' strategy returns a Query object that cannot participate in
+# selectin batching and always round-trips - prefer write_only.)
+# =============================================================================
+
+
 # =============================================================================
 # MYSQL TIMESTAMP EXAMPLE (Optional)
 # =============================================================================
@@ -286,7 +357,7 @@ class Tag:
 #     """Article model with timestamp tracking."""
 #
 #     __tablename__ = 'articles'
-#     __table_args__ = {'autoload': True, 'mysql_engine': 'InnoDB'}
+#     __table_args__ = {'mysql_engine': 'InnoDB'}
 #
 #     id = Column(Integer, primary_key=True, autoincrement=True)
 #
@@ -310,7 +381,7 @@ class Tag:
 #     """Order model with status enum."""
 #
 #     __tablename__ = 'orders'
-#     __table_args__ = {'autoload': True, 'mysql_engine': 'InnoDB'}
+#     __table_args__ = {'mysql_engine': 'InnoDB'}
 #
 #     id = Column(Integer, primary_key=True, autoincrement=True)
 #
@@ -340,7 +411,7 @@ class Tag:
 #    @mapper_registry.mapped
 #    class CrossDbReference:
 #        __tablename__ = 'references'
-#        __table_args__ = {'autoload': True}
+#        __table_args__ = {'mysql_engine': 'InnoDB'}
 #
 #        id = Column(Integer, primary_key=True)
 #        other_id = Column(Integer, ForeignKey('other_db.other_table.id'))
@@ -360,28 +431,49 @@ class Tag:
 # FINALIZE MODEL CLASSES
 # =============================================================================
 #
-# Model classes are configured automatically via the @mapper_registry.mapped
-# decorator when this module is imported. The configure_mappers() call below
-# validates all relationships are properly configured.
+# Model classes are mapped via the @mapper_registry.mapped decorator when
+# this module is imported. Relationship configuration is DEFERRED: the
+# register_models() call below records this registry, and the application
+# calls dm_dbcore.finalize_models() once after all model modules are
+# imported. This avoids re-walking the full mapper graph per module
+# (configure_mappers() is O(all relationships) on every call).
 #
-# No explicit load function is needed. Simply import your model classes:
+# Simply import your model classes, then finalize once at startup:
 #   from myproject_models import User, Post
 # =============================================================================
 
-# Validate all mapper relationships
-configure_mappers()
+# Defer relationship validation to dm_dbcore.finalize_models()
+register_models(mapper_registry)
 
-logger.info("MySQL model classes configured successfully")
+logger.info("MySQL model classes registered")
 
 
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
+def strict_query(stmt, *loads):
+    """
+    Eagerly load the listed relationships and forbid all other lazy loads.
+
+    Relationships not listed raise InvalidRequestError instead of silently
+    emitting one SELECT per row, so N+1 regressions fail fast in tests:
+
+        stmt = strict_query(select(User), User.posts)
+        users = session.scalars(stmt).all()
+    """
+    from sqlalchemy.orm import selectinload, raiseload
+    return stmt.options(*[selectinload(load) for load in loads], raiseload('*'))
+
+
 def get_database_info(dbc):
     """
     Get information about the MySQL database.
 
+    All of the information comes back in ONE query (a UNION ALL keyed by a
+    discriminator column) instead of three serial round trips, so the call
+    pays client-server latency once.
+
     Args:
         dbc: DatabaseConnection instance
 
@@ -399,33 +491,30 @@ def get_database_info(dbc):
 
     try:
         with session_scope(dbc) as session:
-            # Get current database name
-            result = session.execute(text("SELECT DATABASE()"))
-            info['database_name'] = result.scalar()
-
-            # Get database character set and collation
             result = session.execute(
                 text("""
-                    SELECT DEFAULT_CHARACTER_SET_NAME, DEFAULT_COLLATION_NAME
+                    SELECT 'db' AS k, DATABASE() AS a, NULL AS b
+                    UNION ALL
+                    SELECT 'meta', DEFAULT_CHARACTER_SET_NAME, DEFAULT_COLLATION_NAME
                     FROM information_schema.SCHEMATA
                     WHERE SCHEMA_NAME = DATABASE()
-                """)
-            )
-            row = result.first()
-            if row:
-                info['character_set'] = row[0]
-                info['collation'] = row[1]
-
-            # Get table list
-            result = session.execute(
-                text("""
-                    SELECT TABLE_NAME
+                    UNION ALL
+                    SELECT 'tbl', TABLE_NAME, NULL
                     FROM information_schema.TABLES
                     WHERE TABLE_SCHEMA = DATABASE()
-                    ORDER BY TABLE_NAME
+                    ORDER BY k, a
                 """)
             )
-            info['tables'] = [row[0] for row in result]
+
+            # Demultiplex the rows by discriminator
+            for k, a, b in result:
+                if k == 'db':
+                    info['database_name'] = a
+                elif k == 'meta':
+                    info['character_set'] = a
+                    info['collation'] = b
+                else:
+                    info['tables'].append(a)
 
     except Exception as e:
         logger.error(f"Failed to get database info: {e}")
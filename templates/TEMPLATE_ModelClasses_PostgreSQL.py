@@ -17,14 +17,26 @@
 # [ ] 8. Test with main() function
 # =============================================================================
 
+import os
 import logging
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Table
-from sqlalchemy.orm import relationship, configure_mappers, registry
+import functools
+from sqlalchemy import Column, Integer, BigInteger, Identity, String, Text, DateTime, Boolean, ForeignKey, Table, Index, text, inspect, event
+from sqlalchemy.orm import relationship, registry, deferred
 
-from dm_dbcore import DatabaseConnection, session_scope
+from dm_dbcore import DatabaseConnection, session_scope, register_models
 
 logger = logging.getLogger(__name__)
 
+# =============================================================================
+# STRICT LOADING TOGGLE
+# =============================================================================
+# Set DMDBCORE_STRICT_LOADING=1 in dev/CI to turn any accidental lazy
+# relationship SELECT into an exception instead of a silent N+1 query storm.
+# Unset (production) this is plain batched selectin loading - zero runtime
+# cost either way.
+
+_LAZY = 'raise_on_sql' if os.environ.get('DMDBCORE_STRICT_LOADING') else 'selectin'
+
 # =============================================================================
 # POSTGRESQL SCHEMA CONFIGURATION
 # =============================================================================
@@ -39,6 +51,61 @@ SCHEMA_NAME = 'myschema'  # TODO: Replace with your schema name
 
 mapper_registry = registry()
 
+# =============================================================================
+# SCHEMA REFLECTION (one round trip, cached)
+# =============================================================================
+# Putting 'autoload': True in every __table_args__ makes SQLAlchemy reflect
+# each table with its own catalog queries at import time - 5+ serial round
+# trips before the first real query runs. Reflecting the whole schema in one
+# metadata.reflect() call batches those catalog lookups into a single pass,
+# and the lru_cache guard makes repeat calls free. Cross-process warm starts
+# are covered by DatabaseConnection's metadata cache (cache_name=...), which
+# skips the database entirely.
+#
+# With every column declared explicitly below, reflection is OPTIONAL -
+# imports cost zero round trips. Call _reflect_once() only if the live
+# schema carries extra columns the models should pick up at runtime:
+#
+#     db = DatabaseConnection(database_connection_string=...)
+#     _reflect_once(db.engine)   # optional
+#     finalize_models()
+
+@functools.lru_cache(maxsize=None)
+def _reflect_once(engine):
+    """
+    Reflect every table in SCHEMA_NAME into the registry metadata.
+
+    extend_existing=True merges reflected columns into the tables already
+    declared below - the same augmentation 'autoload' performed, but for
+    all tables in one batch instead of one round trip each. Cached per
+    engine, so repeated calls are no-ops.
+    """
+    mapper_registry.metadata.reflect(
+        bind=engine,
+        schema=SCHEMA_NAME,
+        views=False,
+        extend_existing=True
+    )
+
+# =============================================================================
+# ENGINE TUNING NOTES
+# =============================================================================
+# The engine itself is built by dm_dbcore.DatabaseConnection, which already
+# passes query_cache_size=1200 (compiled-SQL cache) and, for PostgreSQL,
+# insertmanyvalues_page_size=1000 (multi-row INSERT batching - the
+# SQLAlchemy 2.0 / psycopg3 equivalent of psycopg2's execute_values).
+# Two things can silently defeat the statement cache from the model side:
+#
+# 1. Custom types must declare cache_ok = True (PGPoint / PGPolygon in
+#    dm_dbcore.adapters already do). A type without it disables caching
+#    for every statement that references it.
+# 2. Building statements from fresh literal values instead of bindparam()
+#    produces a new cache key per call.
+#
+# To catch regressions, call install_cache_assertion(db.engine) in dev/CI
+# (see UTILITY FUNCTIONS below) - it raises on the first statement that
+# executes without a compiled cache.
+
 # =============================================================================
 # POSTGRESQL-SPECIFIC FEATURES
 # =============================================================================
@@ -46,7 +113,7 @@ mapper_registry = registry()
 # PostgreSQL supports advanced features that you can use in your models:
 #
 # 1. SCHEMAS - Organize tables into logical groups
-#    __table_args__ = {'schema': 'myschema', 'autoload': True}
+#    __table_args__ = {'schema': 'myschema'}
 #
 # 2. CUSTOM TYPES - Point, Polygon (via dm-dbcore adapters)
 #    from dm_dbcore.adapters.postgresql.pggeometry import PGPoint, PGPolygon
@@ -86,35 +153,70 @@ class User:
     - Serial primary key (auto-increment)
     - Timestamps
     - One-to-many relationships
+
+    Loading: collections default to one batched 'WHERE fk IN (...)' query
+    per relationship (selectin) instead of one SELECT per parent. As a
+    dev-time guard against regressions, forbid all implicit lazy loads on
+    a query with options(raiseload('*')) - or use the strict_query()
+    helper at the bottom of this module.
     """
 
     __tablename__ = 'users'
+    # Table comments live in _TABLE_COMMENTS below (batched DDL) rather
+    # than a per-table 'comment' key, which costs one COMMENT ON round
+    # trip per table during create_all.
     __table_args__ = {
-        'schema': SCHEMA_NAME,
-        'autoload': True,
-        'comment': 'User accounts table'  # PostgreSQL supports table comments
+        'schema': SCHEMA_NAME
     }
 
     # Primary key (required)
     id = Column(Integer, primary_key=True)
 
+    # Columns are declared explicitly (generate them once with sqlacodegen
+    # against your live schema) rather than reflected: imports make zero
+    # database round trips, the compiled-statement cache always has known
+    # type cache keys, and mypy/pyright can check attribute access.
+    username = Column(String(64), unique=True, nullable=False)
+    email = Column(String(255), unique=True, nullable=False)
+    created_at = Column(DateTime)
+    is_active = Column(Boolean, default=True)
+
     # Relationships
+    #
+    # DB-level delete cascade: the FK carries ON DELETE CASCADE and
+    # passive_deletes=True stops the ORM from SELECTing every child just to
+    # delete it row by row - one parent DELETE ripples through inside the
+    # database. If you rely on Python-side delete hooks (before_delete
+    # events), move that logic to DB triggers or revert per relationship.
     posts = relationship(
         'Post',
         back_populates='author',
-        lazy='select',
-        cascade='all, delete-orphan'
+        lazy=_LAZY,
+        cascade='save-update, merge',
+        passive_deletes=True
     )
 
+    # 1:1 scalar: fold the profile row into the parent query with a joined
+    # eager load - one round trip instead of two per user. Joined loading
+    # duplicates parent columns per child row, so it only pays off when the
+    # child cardinality is <= 1, which is exactly this case. innerjoin=False
+    # keeps LEFT OUTER semantics since a profile row is not guaranteed.
     profile = relationship(
         'UserProfile',
         back_populates='user',
         uselist=False,  # One-to-one
-        cascade='all, delete-orphan'
+        lazy='joined',
+        innerjoin=False,
+        cascade='save-update, merge',
+        passive_deletes=True
     )
 
     def __repr__(self):
-        return f"<User(id={self.id})>"
+        # Read the PK from the identity key rather than self.id - no
+        # attribute access, so repr of an expired or detached instance
+        # (e.g. in a log line) never triggers a refresh SELECT.
+        ident = inspect(self).identity or (None,)
+        return f"<User(id={ident[0]})>"
 
 
 @mapper_registry.mapped
@@ -125,60 +227,107 @@ class UserProfile:
 
     __tablename__ = 'user_profiles'
     __table_args__ = {
-        'schema': SCHEMA_NAME,
-        'autoload': True
+        'schema': SCHEMA_NAME
     }
 
     id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, ForeignKey(f'{SCHEMA_NAME}.users.id'), unique=True, nullable=False)
-
-    # One-to-one relationship
+    # Direct column reference: the target table (and its schema) come from
+    # the User class itself, so configure_mappers() skips the string-to-
+    # table lookup and the schema name lives in exactly one place.
+    user_id = Column(Integer, ForeignKey(User.id, ondelete='CASCADE'), unique=True, nullable=False)
+
+    display_name = Column(String(128))
+    bio = Column(Text)
+
+    # One-to-one relationship - direct class reference (User is defined
+    # above) skips the string resolver pass in configure_mappers(); keep
+    # strings only for classes defined later in the module.
+    # innerjoin=True is safe here because user_id is NOT NULL.
     user = relationship(
-        'User',
-        back_populates='profile'
+        User,
+        back_populates='profile',
+        lazy='joined',
+        innerjoin=True
     )
 
     def __repr__(self):
-        return f"<UserProfile(id={self.id}, user_id={self.user_id})>"
+        ident = inspect(self).identity or (None,)
+        return f"<UserProfile(id={ident[0]})>"
 
 
 @mapper_registry.mapped
 class Post:
     """
     Blog post model - demonstrates text content and timestamps.
+
+    SOFT-DELETE NOTE: if posts carry a deleted_at column, don't bolt
+    "WHERE deleted_at IS NULL" onto every query - register the filter once
+    per session so eager loads are filtered too:
+
+        from sqlalchemy.orm import with_loader_criteria
+        criteria = [with_loader_criteria(Post, Post.deleted_at.is_(None),
+                                         include_aliases=True)]
+        with session_scope(db, loader_criteria=criteria) as session:
+            ...
     """
 
     __tablename__ = 'posts'
-    __table_args__ = {
-        'schema': SCHEMA_NAME,
-        'autoload': True
-    }
+    # PostgreSQL does NOT auto-index foreign key columns; without this,
+    # every selectin load of User.posts seq-scans the table. Declaring the
+    # index here makes metadata.create_all() create it and documents intent.
+    __table_args__ = (
+        Index('ix_posts_author_id', 'author_id'),
+        {'schema': SCHEMA_NAME}
+    )
 
-    id = Column(Integer, primary_key=True)
-    author_id = Column(Integer, ForeignKey(f'{SCHEMA_NAME}.users.id'), nullable=False)
+    # High-ingest table: BigInteger avoids the 2.1B serial ceiling, and
+    # Identity(cache=100) hands each backend 100 sequence values per
+    # nextval() call, amortizing the allocator round trip across inserts.
+    id = Column(BigInteger, Identity(always=True, cache=100), primary_key=True)
+    author_id = Column(Integer, ForeignKey(User.id, ondelete='CASCADE'), nullable=False)
+
+    title = Column(String(255), nullable=False)
+    created_at = Column(DateTime)
+
+    # Wide text column, fetched on demand: list views loading hundreds of
+    # posts for ids/titles shouldn't drag every body over the wire.
+    # Callers that do need it opt back in per query:
+    #     session.scalars(select(Post).options(undefer(Post.content)))
+    # Plain attribute access on a loaded instance still works (one extra
+    # SELECT for that row).
+    content = deferred(Column(Text))
 
     # Relationships
+    #
+    # Scalar many-to-one sides load cheapest as a join folded into the
+    # parent query (innerjoin=True is valid because the FK is NOT NULL).
+    # Keep collections on selectin - 'joined' on a collection multiplies
+    # parent rows per child.
     author = relationship(
-        'User',
-        back_populates='posts'
+        User,
+        back_populates='posts',
+        lazy='joined',
+        innerjoin=True
     )
 
     comments = relationship(
         'Comment',
         back_populates='post',
-        lazy='select',
-        cascade='all, delete-orphan'
+        lazy=_LAZY,
+        cascade='save-update, merge',
+        passive_deletes=True
     )
 
     tags = relationship(
         'Tag',
         secondary=lambda: post_tags_association,
         back_populates='posts',
-        lazy='select'
+        lazy=_LAZY
     )
 
     def __repr__(self):
-        return f"<Post(id={self.id}, author_id={self.author_id})>"
+        ident = inspect(self).identity or (None,)
+        return f"<Post(id={ident[0]})>"
 
 
 @mapper_registry.mapped
@@ -188,27 +337,66 @@ class Comment:
     """
 
     __tablename__ = 'comments'
-    __table_args__ = {
-        'schema': SCHEMA_NAME,
-        'autoload': True
-    }
+    __table_args__ = (
+        Index('ix_comments_post_id', 'post_id'),
+        Index('ix_comments_author_id', 'author_id'),
+        {'schema': SCHEMA_NAME}
+    )
 
-    id = Column(Integer, primary_key=True)
-    post_id = Column(Integer, ForeignKey(f'{SCHEMA_NAME}.posts.id'), nullable=False)
-    author_id = Column(Integer, ForeignKey(f'{SCHEMA_NAME}.users.id'), nullable=False)
+    id = Column(BigInteger, Identity(always=True, cache=100), primary_key=True)
+    post_id = Column(BigInteger, ForeignKey(Post.id, ondelete='CASCADE'), nullable=False)
+    author_id = Column(Integer, ForeignKey(User.id, ondelete='CASCADE'), nullable=False)
+
+    content = Column(Text)
+    created_at = Column(DateTime)
 
     post = relationship(
-        'Post',
-        back_populates='comments'
+        Post,
+        back_populates='comments',
+        lazy='joined',
+        innerjoin=True
     )
 
     author = relationship(
-        'User',
-        foreign_keys=[author_id]
+        User,
+        foreign_keys=[author_id],
+        lazy='joined',
+        innerjoin=True
     )
 
     def __repr__(self):
-        return f"<Comment(id={self.id}, post_id={self.post_id})>"
+        ident = inspect(self).identity or (None,)
+        return f"<Comment(id={ident[0]})>"
+
+
+# =============================================================================
+# DECLARATIVE PARTITIONING EXAMPLE (Optional)
+# =============================================================================
+# For write-heavy tables at the 10^8-row scale (comments is the usual
+# suspect), hash-partitioning on the hot filter column splits one huge
+# B-tree into many small ones: queries filtered by post_id prune to one
+# partition, bulk inserts spread across them, and autovacuum runs per
+# partition. CAVEAT: PostgreSQL requires the partition key to be part of
+# the primary key, so Comment would need PRIMARY KEY (id, post_id) - a
+# schema change, which is why this ships as an example rather than being
+# applied to the Comment class above.
+#
+# class Comment:
+#     __tablename__ = 'comments'
+#     __table_args__ = (
+#         {'schema': SCHEMA_NAME,
+#          'postgresql_partition_by': 'HASH (post_id)'},
+#     )
+#     id = Column(BigInteger, Identity(always=True), primary_key=True)
+#     post_id = Column(BigInteger, ForeignKey(Post.id, ondelete='CASCADE'),
+#                      primary_key=True, nullable=False)
+#
+# Then create the partitions once, in a migration:
+#
+#     CREATE TABLE myschema.comments_p0 PARTITION OF myschema.comments
+#         FOR VALUES WITH (MODULUS 16, REMAINDER 0);
+#     -- ... repeat for remainders 1-15
+# =============================================================================
 
 
 # =============================================================================
@@ -219,33 +407,85 @@ class Comment:
 post_tags_association = Table(
     'post_tags',
     mapper_registry.metadata,
-    Column('post_id', Integer, ForeignKey(f'{SCHEMA_NAME}.posts.id'), primary_key=True),
-    Column('tag_id', Integer, ForeignKey(f'{SCHEMA_NAME}.tags.id'), primary_key=True),
+    Column('post_id', BigInteger, ForeignKey(Post.id, ondelete='CASCADE'), primary_key=True),
+    # Tag is defined below this table, so its FK target must stay a string
+    Column('tag_id', Integer, ForeignKey(f'{SCHEMA_NAME}.tags.id', ondelete='CASCADE'), primary_key=True),
+    # The composite PK index covers (post_id, tag_id) lookups, but
+    # Tag.posts loads filter by tag_id alone and need their own index.
+    # INCLUDE (post_id) makes it a covering index: selectin loads of
+    # Tag.posts are answered by an index-only scan, no heap fetches.
+    Index('ix_post_tags_tag_id', 'tag_id', postgresql_include=['post_id']),
     schema=SCHEMA_NAME
 )
 
 
+# Leave 10% free space per heap page so updates can stay on-page (HOT),
+# avoiding index-entry churn on tag reshuffles. SQLAlchemy only accepts
+# postgresql_with on Index, not Table, so the storage parameter is set by
+# ALTER TABLE immediately after creation - it affects pages written from
+# then on, so it must run before any data loads.
+@event.listens_for(post_tags_association, 'after_create')
+def _set_post_tags_fillfactor(target, connection, **kw):
+    connection.exec_driver_sql(
+        f"ALTER TABLE {SCHEMA_NAME}.{target.name} SET (fillfactor = 90)"
+    )
+
+
 @mapper_registry.mapped
 class Tag:
     """Tag model for categorizing posts."""
 
     __tablename__ = 'tags'
     __table_args__ = {
-        'schema': SCHEMA_NAME,
-        'autoload': True
+        'schema': SCHEMA_NAME
     }
 
     id = Column(Integer, primary_key=True)
+    name = Column(String(64), unique=True, nullable=False)
 
     posts = relationship(
-        'Post',
+        Post,
         secondary=post_tags_association,
         back_populates='tags',
-        lazy='select'
+        lazy=_LAZY
     )
 
     def __repr__(self):
-        return f"<Tag(id={self.id})>"
+        ident = inspect(self).identity or (None,)
+        return f"<Tag(id={ident[0]})>"
+
+
+# =============================================================================
+# TABLE COMMENTS (batched DDL)
+# =============================================================================
+# A 'comment' key in each __table_args__ makes create_all() issue one
+# COMMENT ON TABLE round trip per table after its CREATE. Collecting the
+# comments here and emitting them in a single batched statement after the
+# whole metadata is created reduces K round trips to 1 - noticeable for
+# test fixtures that recreate the schema per test.
+
+_TABLE_COMMENTS = {
+    'users': 'User accounts table',
+    'posts': 'Blog posts',
+    'comments': 'Comments on posts',
+    'tags': 'Post categorization tags',
+}
+
+
+@event.listens_for(mapper_registry.metadata, 'after_create')
+def _emit_table_comments(target, connection, tables=None, **kw):
+    # create_all() passes the tables it actually created (a subset on
+    # checkfirst runs or explicit tables=[...] calls); only comment on
+    # those, or COMMENT ON a never-created table fails the whole create.
+    created = {table.name for table in tables} if tables is not None else set(_TABLE_COMMENTS)
+    statements = [
+        "COMMENT ON TABLE {}.{} IS '{}'".format(
+            SCHEMA_NAME, table, comment.replace("'", "''"))
+        for table, comment in _TABLE_COMMENTS.items()
+        if table in created
+    ]
+    if statements:
+        connection.exec_driver_sql(';\n'.join(statements))
 
 
 # =============================================================================
@@ -261,8 +501,7 @@ class Tag:
 #
 #     __tablename__ = 'locations'
 #     __table_args__ = {
-#         'schema': SCHEMA_NAME,
-#         'autoload': True
+#         'schema': SCHEMA_NAME
 #     }
 #
 #     id = Column(Integer, primary_key=True)
@@ -287,8 +526,7 @@ class Tag:
 #
 #     __tablename__ = 'articles'
 #     __table_args__ = {
-#         'schema': SCHEMA_NAME,
-#         'autoload': True
+#         'schema': SCHEMA_NAME
 #     }
 #
 #     # UUID primary key
@@ -320,69 +558,359 @@ class Tag:
 # =============================================================================
 
 
+# =============================================================================
+# PER-INSTANCE MEMORY (why these classes have no __slots__)
+# =============================================================================
+# Each ORM instance carries a __dict__ (~100+ bytes empty) plus an
+# InstanceState, which dominates the per-row cost when loading 10^5+ rows.
+# __slots__ would normally fix that, but SQLAlchemy's instrumentation
+# stores column values IN the instance __dict__ - a slotted mapped class
+# simply breaks. When the per-object overhead matters (bulk reporting,
+# migrations, exports), skip ORM hydration instead and fetch plain row
+# tuples, which have no __dict__ at all:
+#
+#     from dm_dbcore import fast_select
+#     rows = fast_select(session, Post, 'id', 'author_id')
+#
+# Combined with the streaming pattern below, memory stays flat regardless
+# of row count.
+
+# =============================================================================
+# BULK ITERATION (server-side cursors)
+# =============================================================================
+# Reading a large table with session.query(Post).all() materializes every
+# row at once - O(rows) memory. Stream instead with a server-side cursor
+# and batched fetches, keeping memory at O(yield_per):
+#
+#     stmt = select(Post).execution_options(yield_per=1000, stream_results=True)
+#     for batch in session.execute(stmt).scalars().partitions():
+#         process(batch)
+#
+# The dm-dbcore helper wraps the same thing for Query objects:
+#
+#     from dm_dbcore import stream
+#     for post in stream(session.query(Post), chunk=1000):
+#         process(post)
+#
+# WARNING: 'joined' eager loads on collections are incompatible with
+# yield_per (one parent's rows can straddle a batch boundary). Use selectin
+# loading - this template's collection default - or lazy='raise' plus an
+# explicit selectinload() per batch.
+# =============================================================================
+
+
 # =============================================================================
 # FINALIZE MODEL CLASSES
 # =============================================================================
 #
-# Model classes are configured automatically via the @mapper_registry.mapped
-# decorator when this module is imported. The configure_mappers() call below
-# validates all relationships are properly configured.
+# Model classes are mapped via the @mapper_registry.mapped decorator when
+# this module is imported. Relationship configuration is DEFERRED: the
+# register_models() call below records this registry, and the application
+# calls dm_dbcore.finalize_models() once after all model modules are
+# imported. This avoids re-walking the full mapper graph per module
+# (configure_mappers() is O(all relationships) on every call).
 #
-# No explicit load function is needed. Simply import your model classes:
+# Simply import your model classes, then finalize once at startup:
 #   from myschema_models import User, Post
+#
+# LAZY FALLBACK: if the application never calls finalize_models() - e.g. a
+# CLI tool that imports this module only for the User symbol and exits -
+# nothing is lost. SQLAlchemy configures mappers automatically on first
+# ORM use (instantiation or query), so the O(classes x relationships)
+# configuration walk is paid on first use or never, not at import. Calling
+# finalize_models() at startup just moves that cost to a predictable
+# moment before request traffic.
 # =============================================================================
 
-# Validate all mapper relationships
-configure_mappers()
+# Defer relationship validation to dm_dbcore.finalize_models()
+register_models(mapper_registry)
 
-logger.info(f"{SCHEMA_NAME} PostgreSQL model classes configured successfully")
+logger.info(f"{SCHEMA_NAME} PostgreSQL model classes registered")
 
 
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
-def get_schema_info(dbc):
+def attach_tags(session, post_id, tag_ids):
+    """
+    Attach tags to a post in one INSERT per 1000 pairs.
+
+    Looping session.add() per tag costs one round trip and one WAL flush
+    per row; a single multi-VALUES INSERT collapses that to one.
+    ON CONFLICT DO NOTHING makes the call idempotent - already-attached
+    tags are skipped inside the database instead of raising
+    IntegrityError. Chunked at 1000 pairs to stay comfortably under
+    PostgreSQL's 65535 bind-parameter limit.
+
+        with session_scope(db) as session:
+            attach_tags(session, post.id, [1, 2, 3])
+    """
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+    if not tag_ids:
+        return
+
+    chunk_size = 1000
+    for i in range(0, len(tag_ids), chunk_size):
+        stmt = (
+            pg_insert(post_tags_association)
+            .values([{'post_id': post_id, 'tag_id': tag_id}
+                     for tag_id in tag_ids[i:i + chunk_size]])
+            .on_conflict_do_nothing(index_elements=['post_id', 'tag_id'])
+        )
+        session.execute(stmt)
+
+
+# Rows per INSERT statement. Matches the engine's insertmanyvalues_page_size
+# (set by DatabaseConnection) so each chunk compiles to exactly one
+# multi-VALUES statement.
+BULK_INSERT_BATCH = 1000
+
+
+def bulk_insert_posts(session, rows):
+    """
+    Mass-ingest posts and return their generated primary keys.
+
+    Per-row session.add() constructs an ORM object, fires events and
+    flushes one INSERT per row; batches of 1000 dicts through a Core
+    insert() are 1-2 orders of magnitude faster on PostgreSQL. RETURNING
+    delivers the new ids in the same round trip - no post-insert refresh
+    per row. (The legacy bulk_save_objects() API is superseded by this
+    pattern in SQLAlchemy 2.0.)
+
+        with session_scope(db) as session:
+            ids = bulk_insert_posts(session, [{'author_id': 1, ...}, ...])
+
+    :param session: the session to execute against
+    :param rows: list of dicts of column values, one per post
+    :return: list of generated post ids, in input order
+    """
+    from sqlalchemy import insert
+
+    ids = []
+    for i in range(0, len(rows), BULK_INSERT_BATCH):
+        # sort_by_parameter_order makes the RETURNING rows come back in
+        # input order - without it, insertmanyvalues batches may return
+        # ids in arbitrary order.
+        result = session.execute(
+            insert(Post).returning(Post.id, sort_by_parameter_order=True),
+            rows[i:i + BULK_INSERT_BATCH]
+        )
+        ids.extend(result.scalars())
+    return ids
+
+
+def load_user_full():
+    """
+    Loader options for a user with posts, comments, tags and profile.
+
+    Hand-rolled joinedload/selectinload chains are the main source of N+1
+    regressions; naming the bundle keeps every caller on the same fixed
+    number of batched queries, and raiseload('*') turns any path not
+    listed here into an immediate error instead of a silent query storm.
+
+        users = session.scalars(select(User).options(*load_user_full())).all()
+    """
+    from sqlalchemy.orm import selectinload, raiseload
+    return (
+        selectinload(User.posts).selectinload(Post.comments),
+        selectinload(User.posts).selectinload(Post.tags),
+        selectinload(User.profile),
+        raiseload('*'),
+    )
+
+
+def load_post_listing():
+    """
+    Loader options for a post list view: author and tags only.
+
+    Uses joinedload for the scalar author (folds into the parent query,
+    matching the relationship's own configuration) and selectinload for
+    the tags collection. Everything else - comments, bodies - raises
+    rather than lazy-loading.
+    """
+    from sqlalchemy.orm import joinedload, selectinload, raiseload
+    return (
+        joinedload(Post.author),
+        selectinload(Post.tags),
+        raiseload('*'),
+    )
+
+
+def strict_query(stmt, *loads):
+    """
+    Eagerly load the listed relationships and forbid all other lazy loads.
+
+    Relationships not listed raise InvalidRequestError instead of silently
+    emitting one SELECT per row, so N+1 regressions fail fast in tests:
+
+        stmt = strict_query(select(User), User.posts)
+        users = session.scalars(stmt).all()
+    """
+    from sqlalchemy.orm import selectinload, raiseload
+    return stmt.options(*[selectinload(load) for load in loads], raiseload('*'))
+
+
+def install_cache_assertion(engine):
+    """
+    Fail fast (dev/CI only) if a statement compiles without a cache key.
+
+    A compiled statement whose cache_key is None is uncacheable - usually
+    a custom type missing cache_ok = True - and SQLAlchemy silently
+    recompiles its SQL on every execution. DDL is exempt (it is never
+    cached). Do not install this in production; it runs on every cursor
+    execute.
+    """
+    from sqlalchemy import event
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _assert_cached(conn, cursor, statement, parameters, context, executemany):
+        if context is not None and context.compiled is not None and not context.isddl:
+            assert context.compiled.cache_key is not None, (
+                f"statement compiled without a cache key: {statement[:80]!r}"
+            )
+
+
+# Schema existence and table list fused into one statement against
+# pg_catalog directly. The information_schema views are portable but
+# expensive on PostgreSQL - they wrap pg_catalog in extra joins and
+# per-row permission filtering - while pg_namespace/pg_class resolve via
+# catalog indexes in microseconds. The CTE finds the schema oid; the
+# LEFT JOIN carries the table names ('r' = ordinary, 'p' = partitioned)
+# along in the same result. Zero rows means the schema does not exist;
+# one row with a NULL table_name means it exists but is empty. Built
+# once at module level so every call hits the compiled-statement cache.
+_SCHEMA_INFO_STMT = text("""
+    WITH s AS (
+        SELECT oid
+        FROM pg_catalog.pg_namespace
+        WHERE nspname = :schema
+    )
+    SELECT s.oid AS schema_oid, c.relname AS table_name
+    FROM s
+    LEFT JOIN pg_catalog.pg_class c
+        ON c.relnamespace = s.oid AND c.relkind IN ('r', 'p')
+    ORDER BY c.relname
+""")
+
+
+# Per-process TTL cache for get_schema_info. Schema layout only changes at
+# DDL time, so serving repeat calls (health checks, admin dashboards) from
+# memory for a few seconds turns a ~1 ms round trip into a dict lookup.
+# Keyed on id(dbc) - DatabaseConnection is a singleton per connection
+# string, so identity is stable for the process lifetime.
+_schema_info_cache = {}
+
+
+def get_schema_info(dbc, ttl=30.0):
     """
     Get information about the PostgreSQL schema.
 
+    Results are cached per connection for `ttl` seconds (pass ttl=0 to
+    bypass, or call get_schema_info.cache_clear() after DDL changes).
+    A cache miss issues a single round trip: the existence check and the
+    table list used to be two sequential queries, which doubled the
+    latency and the connection-pool hold time for a trivially foldable
+    lookup.
+
     Args:
         dbc: DatabaseConnection instance
+        ttl: seconds to serve cached results before re-querying
 
     Returns:
         dict: Schema information
     """
-    from sqlalchemy import text
+    from time import monotonic
+
+    key = id(dbc)
+    hit = _schema_info_cache.get(key)
+    if hit is not None and monotonic() - hit[0] < ttl:
+        return hit[1]
 
     info = {
         'schema_name': SCHEMA_NAME,
-        'tables': [],
+        'tables': (),
         'exists': False
     }
 
     try:
         with session_scope(dbc) as session:
-            # Check if schema exists
+            # Stream in batches of 500 over a server-side cursor rather
+            # than materializing every row up front - memory stays at
+            # O(yield_per) even on schemas with thousands of partitions.
             result = session.execute(
-                text("SELECT schema_name FROM information_schema.schemata WHERE schema_name = :schema"),
+                _SCHEMA_INFO_STMT.execution_options(stream_results=True, yield_per=500),
                 {'schema': SCHEMA_NAME}
             )
-            info['exists'] = result.first() is not None
-
-            if info['exists']:
-                # Get table list
-                result = session.execute(
-                    text("""
-                        SELECT table_name
-                        FROM information_schema.tables
-                        WHERE table_schema = :schema
-                        ORDER BY table_name
-                    """),
-                    {'schema': SCHEMA_NAME}
-                )
-                info['tables'] = [row[0] for row in result]
-
-    except Exception as e:
-        logger.error(f"Failed to get schema info: {e}")
+            tables = []
+            for row in result:
+                info['exists'] = True
+                if row.table_name is not None:
+                    tables.append(row.table_name)
+            # A tuple is leaner than a list (no growth slack) and tells
+            # callers the snapshot is not meant to be mutated.
+            info['tables'] = tuple(tables)
+
+    except Exception:
+        # Don't cache failures - a transient error would otherwise be
+        # served as a false "schema missing" for the rest of the ttl
+        # window, exactly where health checks hurt most.
+        logger.error("Failed to get schema info", exc_info=True)
+        return info
+
+    _schema_info_cache[key] = (monotonic(), info)
+    return info
+
 
+get_schema_info.cache_clear = _schema_info_cache.clear
+
+
+async def get_schema_info_async(async_session_factory, ttl=30.0):
+    """
+    Async variant of get_schema_info for event-loop callers.
+
+    Web handlers on the async engine shouldn't block the loop on a sync
+    round trip. Pass the async_sessionmaker from your connection module
+    (see TEMPLATE_Connection.py's get_async_database_connection); the
+    same fused pg_catalog statement and TTL cache apply. The psycopg
+    async driver's prepare_threshold promotes this repeated statement to
+    a server-side prepared statement, skipping parse/plan on hot calls.
+
+        _, session_factory = get_async_database_connection()
+        info = await get_schema_info_async(session_factory)
+    """
+    from time import monotonic
+
+    key = id(async_session_factory)
+    hit = _schema_info_cache.get(key)
+    if hit is not None and monotonic() - hit[0] < ttl:
+        return hit[1]
+
+    info = {
+        'schema_name': SCHEMA_NAME,
+        'tables': (),
+        'exists': False
+    }
+
+    try:
+        async with async_session_factory() as session:
+            result = await session.execute(_SCHEMA_INFO_STMT, {'schema': SCHEMA_NAME})
+            tables = []
+            for row in result:
+                info['exists'] = True
+                if row.table_name is not None:
+                    tables.append(row.table_name)
+            info['tables'] = tuple(tables)
+
+    except Exception:
+        # As in the sync variant, never cache failures - a blip would be
+        # reported as "schema missing" for the rest of the ttl window.
+        logger.error("Failed to get schema info", exc_info=True)
+        return info
+
+    _schema_info_cache[key] = (monotonic(), info)
     return info
+
+
+get_schema_info_async.cache_clear = _schema_info_cache.clear